@@ -1,11 +1,22 @@
 import os
 import json
 import logging
+from utils import json_utils
 from config.constants import (
     DEFAULT_SOCKET_URI, DEFAULT_LANGUAGE, DEFAULT_ACCENT_COLOR,
     DEFAULT_BACKGROUND_IMAGE, DEFAULT_MAX_STRENGTH, CONFIG_FILE
 )
 
+# 配置项表：(字段名, 类型, 缺省值)，加载时按表一次完成取值和类型校验
+_CONFIG_SCHEMA = (
+    ('socket_uri', str, ""),
+    ('language', str, "en_US"),  # 只使用 language 字段
+    ('accent_color', str, "#7f744f"),
+    ('background_image', str, ""),
+    ('max_strength_a', int, 50),
+    ('max_strength_b', int, 50),
+)
+
 class Settings:
     def __init__(self):
         # 使用constants.py中定义的常量
@@ -16,28 +27,39 @@ class Settings:
         self.background_image = DEFAULT_BACKGROUND_IMAGE
         self.max_strength_a = DEFAULT_MAX_STRENGTH['A']
         self.max_strength_b = DEFAULT_MAX_STRENGTH['B']
+        # 最近一次加载的配置内容，供启动时记录日志，避免再次读取和解析配置文件
+        self.config_data = None
         self.load()
         
-    def load(self):
-        """从配置文件加载设置"""
+    def load(self, data=None):
+        """从配置文件加载设置
+        
+        Args:
+            data: 已解析的配置字典，提供时直接使用，不再读取配置文件
+        """
         try:
-            if os.path.exists(self.config_file):
+            if data is None:
+                if not os.path.exists(self.config_file):
+                    logging.warning(f"配置文件不存在: {self.config_file}，将使用默认设置")
+                    return
                 logging.info(f"正在加载配置文件: {self.config_file}")
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    self.socket_uri = config.get('socket_uri', "")
+                data = json_utils.load_file(self.config_file)
                     
-                    # 只使用 language 字段
-                    self.language = config.get('language', "en_US")
-                        
-                    self.accent_color = config.get('accent_color', "#7f744f")
-                    self.background_image = config.get('background_image', "")
-                    self.max_strength_a = config.get('max_strength_a', 50)
-                    self.max_strength_b = config.get('max_strength_b', 50)
-                    logging.info(f"配置已加载: {self.config_file}")
-                    logging.info(f"当前语言设置: {self.language}")
-            else:
-                logging.warning(f"配置文件不存在: {self.config_file}，将使用默认设置")
+            config = data
+            if not isinstance(config, dict):
+                logging.error("配置文件格式错误，应为JSON对象: %s", self.config_file)
+                return
+                
+            for key, value_type, default in _CONFIG_SCHEMA:
+                value = config.get(key, default)
+                # bool是int的子类，整数配置项需单独排除true/false
+                if not isinstance(value, value_type) or (value_type is int and isinstance(value, bool)):
+                    logging.warning("配置项 %s 类型错误: %r，将使用默认值 %r", key, value, default)
+                    value = default
+                setattr(self, key, value)
+            self.config_data = config
+            logging.info(f"配置已加载: {self.config_file}")
+            logging.info(f"当前语言设置: {self.language}")
         except Exception as e:
             logging.error(f"加载配置失败: {str(e)}")
             
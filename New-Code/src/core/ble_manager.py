@@ -1,6 +1,7 @@
 import logging
 import struct
 import asyncio  # 添加asyncio导入
+import sys
 from bleak import BleakClient, BleakScanner
 from bleak.exc import BleakError
 from bleak.backends.scanner import AdvertisementData
@@ -12,8 +13,27 @@ from config.constants import (
 )
 from config.settings import settings
 from core.protocol import ProtocolConverter
+from core.ble_scanner import BLEScannerMixin
 
-class BLEManager:
+log = logging.getLogger(__name__)
+
+# 两次强度写入之间的最小间隔(秒)，期间到达的强度变化合并为一次写入
+STRENGTH_WRITE_INTERVAL = 0.02
+
+# 检查蓝牙功能时最多等待的时长(秒)，收到任意广播即提前结束
+BLUETOOTH_CHECK_TIMEOUT = 1.0
+
+# bleak的WinRT后端默认每次都从设备读取特征值；设备ID不会变化，可以使用系统缓存的值，
+# 省去一次空中读取。其他平台的后端没有该参数
+if sys.platform == 'win32':
+    _CACHED_READ = {'use_cached': True}
+else:
+    _CACHED_READ = {}
+
+# 连接意外断开时的重连等待时间(秒)，每次失败后递增
+RECONNECT_DELAYS = (0.5, 1.0, 2.0)
+
+class BLEManager(BLEScannerMixin):
     def __init__(self, signals):
         """初始化BLE管理器
         
@@ -35,6 +55,34 @@ class BLEManager:
             'A': settings.max_strength_a, 
             'B': settings.max_strength_b
         }
+        
+        # 强度写入任务：连接期间运行，按最新的current_strength合并写入PWM_AB2
+        self._strength_task = None
+        self._strength_pending = None  # 有待写入的强度时置位的asyncio.Event
+        self._strength_future = None  # 下一次写入的结果，等待中的调用共享同一个Future
+        # 最近一次成功写入的PWM_AB2数据，强度在设备上保持不变，相同数据无需重复写入
+        # PWM_A34/B34每次写入只输出0.1秒，不能跳过
+        self._last_ab2 = None
+        # PWM_AB2写入进行中时置位，期间收到的强度通知可能仍是设备上的旧值
+        self._ab2_in_flight = False
+        # 连接时解析的特征值对象，按UUID索引，读写时直接传入以免每次按UUID查找
+        self._chars = {}
+        # 支持无响应写入的特征值UUID，连接时根据特征值属性确定
+        self._write_no_response = set()
+        
+        # 连接期间持续运行的扫描器，从广播数据中缓存信号强度，避免每次读取都重新扫描
+        self._scanner = None
+        self._rssi_cache = {}  # 大写地址 -> (信号强度, 时间戳)
+        
+        # 重置设备时是否同时向PWM_A34/B34发送停止数据；
+        # 强度归零已能停止输出的设备可关闭，重置时只需一次写入
+        self.clear_waves_on_reset = True
+        
+        # 已订阅通知的特征值UUID，订阅电池电量后不再需要定时读取
+        self._notifying = set()
+        
+        # 同一时间只允许一个GATT操作，避免多个协程的读写和连接请求交错
+        self._op_sem = asyncio.Semaphore(1)
 
     async def send_command(self, char_uuid, data):
         """发送命令到BLE设备
@@ -46,9 +94,9 @@ class BLEManager:
         Returns:
             bool: 命令是否发送成功
         """
-        if not self.is_connected or not self.client:
+        if not await self.ensure_connected():
             self.signals.log_message.emit("设备未连接")
-            logging.error("发送命令失败: 设备未连接")
+            log.error("发送命令失败: 设备未连接")
             return False
             
         try:
@@ -56,15 +104,21 @@ class BLEManager:
             if not isinstance(data, bytes):
                 data = bytes(data)
                 
-            # 记录发送的数据
-            logging.info(f"发送命令到特征值 {char_uuid}: {data.hex()}")
-            
-            await self.client.write_gatt_char(char_uuid, data)
-            self.signals.log_message.emit(f"命令发送成功 (特征值: {char_uuid})")
+            # 记录发送的数据，每次写入都会调用，仅在DEBUG级别启用时才转换十六进制
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("发送命令到特征值 %s: %s", char_uuid, data.hex())
+            
+            # 特征值支持时使用无响应写入，省去每次写入等待设备确认的往返
+            response = char_uuid not in self._write_no_response
+            async with self._op_sem:
+                await self.client.write_gatt_char(self._chars.get(char_uuid, char_uuid), data, response=response)
+            if char_uuid == BLE_CHAR_PWM_AB2:
+                self._last_ab2 = data
+            log.debug("命令发送成功 (特征值: %s)", char_uuid)
             return True
         except Exception as e:
             self.signals.log_message.emit(f"命令发送失败: {str(e)}")
-            logging.error(f"命令发送失败: {str(e)}")
+            log.error("命令发送失败: %s", e)
             return False
 
     async def connect(self, address):
@@ -76,43 +130,287 @@ class BLEManager:
         Returns:
             bool: 连接是否成功
         """
+        # 已连接到该设备时直接返回，避免重复连接
+        if self._is_connected_to(address):
+            return True
+            
         try:
             self.signals.log_message.emit(f"正在连接蓝牙设备: {address}")
-            logging.info(f"正在连接蓝牙设备: {address}")
-            
-            self.client = BleakClient(address)
-            await self.client.connect()
-            self.is_connected = True
-            self.device_address = address
+            log.info("正在连接蓝牙设备: %s", address)
+            
+            async with self._op_sem:
+                # 等待期间其他连接请求可能已完成
+                if self._is_connected_to(address):
+                    return True
+                self._last_ab2 = None
+                self.client = BleakClient(address)
+                await self.client.connect()
+                self.is_connected = True
+                self.device_address = address
             
             self.signals.log_message.emit(f"蓝牙设备连接成功: {address}")
-            logging.info(f"蓝牙设备连接成功: {address}")
+            log.info("蓝牙设备连接成功: %s", address)
             
+            self._load_characteristics()
+            await self._start_notify()
+            self._start_strength_writer()
+            await self._start_scanner()
             await self.get_device_id()
             self.signals.connection_changed.emit(True)
             return True
         except Exception as e:
+            self._stop_strength_writer()
+            await self._stop_scanner()
             self.is_connected = False
             self.client = None
             self.device_address = None
             self.signals.log_message.emit(f"蓝牙设备连接失败: {str(e)}")
-            logging.error(f"蓝牙设备连接失败: {address}, 错误={str(e)}")
+            log.error("蓝牙设备连接失败: %s, 错误=%s", address, e)
             self.signals.connection_changed.emit(False)
             return False
             
     async def disconnect(self):
         """断开蓝牙设备连接"""
         if self.client and self.is_connected:
+            self._stop_strength_writer()
+            await self._stop_scanner()
+            await self._stop_notify()
             try:
-                await self.client.disconnect()
+                async with self._op_sem:
+                    await self.client.disconnect()
             except Exception as e:
-                logging.error(f"断开设备连接时发生错误: {str(e)}")
+                log.error("断开设备连接时发生错误: %s", e)
             finally:
                 self.is_connected = False
                 self.client = None
                 self.device_address = None
+                self._last_ab2 = None
+                self._chars.clear()
+                self._write_no_response.clear()
                 self.signals.connection_changed.emit(False)
 
+    def _is_connected_to(self, address):
+        """是否已连接到指定地址的设备"""
+        return (self.is_connected and self.client is not None
+                and self.client.is_connected and self.device_address == address)
+                
+    async def ensure_connected(self):
+        """确保设备处于连接状态
+        
+        连接意外断开时按RECONNECT_DELAYS退避重连，全部失败后标记为已断开；
+        主动断开后不会重连
+        
+        Returns:
+            bool: 设备是否已连接
+        """
+        if not self.is_connected or not self.client:
+            return False
+        if self.client.is_connected:
+            return True
+            
+        address = self.device_address
+        for delay in RECONNECT_DELAYS:
+            log.warning("蓝牙连接已断开，%s秒后尝试重连: %s", delay, address)
+            await asyncio.sleep(delay)
+            # 等待期间可能已被主动断开或已由其他调用重连
+            if not self.is_connected or self.device_address != address:
+                return False
+            if self.client is not None and self.client.is_connected:
+                return True
+            try:
+                # 先找到设备再连接，找不到时交由BleakClient自行按地址查找；
+                # 查找期间不占用GATT操作锁，其他读写不必等待扫描
+                device = await self.find_known_device(address)
+                if not self.is_connected or self.device_address != address:
+                    return False
+                async with self._op_sem:
+                    if self.client is not None and self.client.is_connected:
+                        return True
+                    self.client = BleakClient(device or address)
+                    await self.client.connect()
+                self._last_ab2 = None
+                self._load_characteristics()
+                self._notifying.clear()
+                await self._start_notify()
+                self.signals.log_message.emit(f"蓝牙设备已重新连接: {address}")
+                log.info("蓝牙设备已重新连接: %s", address)
+                return True
+            except Exception as e:
+                log.error("蓝牙设备重连失败: %s, 错误=%s", address, e)
+                
+        # 重连失败，按断开处理；本方法可能在强度写入任务中运行，
+        # 先同步清理全部状态并通知UI，再等待停止扫描器
+        self._stop_strength_writer()
+        self.is_connected = False
+        self.client = None
+        self.device_address = None
+        self._last_ab2 = None
+        self._chars.clear()
+        self._write_no_response.clear()
+        self._notifying.clear()
+        self.signals.log_message.emit(f"蓝牙设备重连失败，连接已断开: {address}")
+        self.signals.connection_changed.emit(False)
+        await self._stop_scanner()
+        return False
+        
+    def _load_characteristics(self):
+        """解析并缓存常用的特征值对象，确定可使用无响应写入的PWM特征值"""
+        self._chars.clear()
+        self._write_no_response.clear()
+        services = self.client.services
+        for char_uuid in (BLE_CHAR_PWM_AB2, BLE_CHAR_PWM_A34, BLE_CHAR_PWM_B34,
+                          BLE_CHAR_BATTERY, BLE_CHAR_DEVICE_ID):
+            char = services.get_characteristic(char_uuid)
+            if char is None:
+                log.warning("未找到特征值: %s", char_uuid)
+                continue
+            self._chars[char_uuid] = char
+            if char_uuid != BLE_CHAR_BATTERY and char_uuid != BLE_CHAR_DEVICE_ID \
+                    and 'write-without-response' in char.properties:
+                self._write_no_response.add(char_uuid)
+        log.debug("支持无响应写入的特征值: %s", self._write_no_response)
+        
+    @property
+    def battery_notifying(self):
+        """电池电量是否通过通知更新"""
+        return BLE_CHAR_BATTERY in self._notifying
+        
+    async def _start_notify(self):
+        """订阅电池电量和强度通知，仅订阅支持通知的特征值"""
+        # 电池电量需在订阅后重新读取一次，此前的值可能来自上一个设备
+        self.battery_level = None
+        handlers = (
+            (BLE_CHAR_BATTERY, self._on_battery_notify),
+            (BLE_CHAR_PWM_AB2, self._on_strength_notify),
+        )
+        for char_uuid, handler in handlers:
+            char = self._chars.get(char_uuid)
+            if char is None or 'notify' not in char.properties:
+                continue
+            try:
+                async with self._op_sem:
+                    await self.client.start_notify(char, handler)
+                self._notifying.add(char_uuid)
+            except Exception as e:
+                log.warning("订阅特征值通知失败: %s, 错误=%s", char_uuid, e)
+        log.debug("已订阅通知的特征值: %s", self._notifying)
+        
+    async def _stop_notify(self):
+        """取消全部通知订阅"""
+        for char_uuid in list(self._notifying):
+            try:
+                async with self._op_sem:
+                    await self.client.stop_notify(self._chars.get(char_uuid, char_uuid))
+            except Exception as e:
+                log.warning("取消特征值通知失败: %s, 错误=%s", char_uuid, e)
+        self._notifying.clear()
+        
+    def _on_battery_notify(self, sender, data):
+        """电池电量通知回调"""
+        if not data:
+            return
+        self.battery_level = int(data[0])
+        self.signals.battery_update.emit(self.battery_level)
+        
+    def _on_strength_notify(self, sender, data):
+        """强度通知回调：设备上的强度被改变时同步当前强度"""
+        if len(data) < 3:
+            return
+        data = bytes(data[:3])
+        # 本程序写入的强度、正在写入或有待写入的强度时忽略，避免旧值覆盖新设置
+        if data == self._last_ab2 or self._ab2_in_flight or self._strength_future is not None:
+            return
+        self._last_ab2 = data
+        a_strength, b_strength = ProtocolConverter.decode_pwm_ab2(data)
+        if a_strength == self.current_strength['A'] and b_strength == self.current_strength['B']:
+            return
+        self.current_strength['A'] = a_strength
+        self.current_strength['B'] = b_strength
+        log.debug("设备强度已变化: A=%s, B=%s", a_strength, b_strength)
+        # 更新UI状态
+        self.signals.status_update.emit({'A': str(a_strength), 'B': str(b_strength)})
+        # 发送强度变更信号
+        self.signals.strength_changed.emit()
+        
+    def _start_strength_writer(self):
+        """启动强度写入任务"""
+        self._stop_strength_writer()
+        self._strength_pending = asyncio.Event()
+        self._strength_task = asyncio.ensure_future(self._strength_writer())
+        
+    def _stop_strength_writer(self):
+        """停止强度写入任务，等待中的调用返回False
+        
+        在写入任务自身中调用时不取消任务，由写入循环在本次写入后自行退出
+        """
+        task, self._strength_task = self._strength_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        future, self._strength_future = self._strength_future, None
+        if future is not None and not future.done():
+            future.set_result(False)
+            
+    async def _strength_writer(self):
+        """强度写入循环
+        
+        等待强度变化，每次写入时读取最新的current_strength，
+        写入期间和间隔内到达的多次变化合并为下一次写入
+        """
+        task = asyncio.current_task()
+        future = None
+        try:
+            while self._strength_task is task:
+                await self._strength_pending.wait()
+                self._strength_pending.clear()
+                future, self._strength_future = self._strength_future, None
+                
+                success = await self._send_ab2()
+                if future is not None and not future.done():
+                    future.set_result(success)
+                future = None
+                
+                # 写入过程中连接已断开，写入任务已被停止
+                if self._strength_task is not task:
+                    break
+                await asyncio.sleep(STRENGTH_WRITE_INTERVAL)
+        finally:
+            # 任务被取消时，正在写入的调用也返回False
+            if future is not None and not future.done():
+                future.set_result(False)
+                
+    async def _send_ab2(self):
+        """编码current_strength并写入PWM_AB2，与上次写入的数据相同时跳过"""
+        data = ProtocolConverter.encode_pwm_ab2(
+            self.current_strength['A'],
+            self.current_strength['B']
+        )
+        if data == self._last_ab2 and self.is_connected:
+            return True
+        self._ab2_in_flight = True
+        try:
+            return await self.send_command(BLE_CHAR_PWM_AB2, data)
+        finally:
+            self._ab2_in_flight = False
+        
+    async def _write_strength(self):
+        """将current_strength写入设备
+        
+        写入任务运行时只登记一次写入请求，并等待包含本次强度的那次写入完成；
+        否则直接发送
+        
+        Returns:
+            bool: 命令是否发送成功
+        """
+        if self._strength_task is None or self._strength_task.done():
+            return await self._send_ab2()
+            
+        future = self._strength_future
+        if future is None:
+            future = self._strength_future = asyncio.get_running_loop().create_future()
+        self._strength_pending.set()
+        # 多个调用共享同一个Future，单个调用被取消时不影响其他调用
+        return await asyncio.shield(future)
+
     async def send_strength_command(self, channel, strength_type, strength_value):
         """发送强度命令到设备
         
@@ -131,16 +429,14 @@ class BLEManager:
             # 使用PWM_AB2特征值发送强度命令
             if channel == 1:  # A通道
                 self.current_strength['A'] = strength_value
-                data = ProtocolConverter.encode_pwm_ab2(strength_value, self.current_strength['B'])
             else:  # B通道
                 self.current_strength['B'] = strength_value
-                data = ProtocolConverter.encode_pwm_ab2(self.current_strength['A'], strength_value)
                 
             # 发送命令
-            return await self.send_command(BLE_CHAR_PWM_AB2, data)
+            return await self._write_strength()
         except Exception as e:
             self.signals.log_message.emit(f"发送强度命令失败: {str(e)}")
-            logging.error(f"发送强度命令失败: {str(e)}")
+            log.error("发送强度命令失败: %s", e)
             return False
 
     async def update_max_strength(self, channel, value):
@@ -172,13 +468,24 @@ class BLEManager:
     async def check_bluetooth_available(self):
         """检查系统是否支持蓝牙功能"""
         try:
-            # 尝试扫描设备，如果成功则说明蓝牙功能可用
-            devices = await BleakScanner.discover(timeout=1.0)  # 使用BleakScanner.discover
+            # 尝试扫描设备，如果成功则说明蓝牙功能可用，收到第一个广播后立即停止
+            found = asyncio.Event()
+            scanner = BleakScanner(
+                detection_callback=lambda device, advertisement_data: found.set(),
+                scanning_mode="active"
+            )
+            await scanner.start()
+            try:
+                await asyncio.wait_for(found.wait(), BLUETOOTH_CHECK_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                await scanner.stop()
             self.has_bluetooth = True
             return True
         except Exception as e:
             self.has_bluetooth = False
-            logging.error(f"蓝牙功能检查失败: {str(e)}")
+            log.error("蓝牙功能检查失败: %s", e)
             return False
             
     def is_bluetooth_available(self):
@@ -195,7 +502,9 @@ class BLEManager:
             # 确保client不为None后再调用read_gatt_char方法
             value = None  # 初始化value变量
             if self.client is not None:
-                value = await self.client.read_gatt_char(BLE_CHAR_DEVICE_ID)
+                async with self._op_sem:
+                    value = await self.client.read_gatt_char(
+                        self._chars.get(BLE_CHAR_DEVICE_ID, BLE_CHAR_DEVICE_ID), **_CACHED_READ)
                 self.device_id = value.hex().upper()
             else:
                 self.signals.log_message.emit("无法获取设备ID：客户端未初始化")
@@ -220,14 +529,16 @@ class BLEManager:
             
         try:
             # 尝试读取电池电量特征值
-            battery_data = await self.client.read_gatt_char(BLE_CHAR_BATTERY)
+            async with self._op_sem:
+                battery_data = await self.client.read_gatt_char(
+                    self._chars.get(BLE_CHAR_BATTERY, BLE_CHAR_BATTERY))
             if battery_data:
                 battery_level = int(battery_data[0])
                 self.battery_level = battery_level  # 保存电池电量
                 return battery_level
             return None
         except Exception as e:
-            logging.error(f"读取电池电量失败: {str(e)}")
+            log.error("读取电池电量失败: %s", e)
             return None
     
     async def read_signal_strength(self):
@@ -240,73 +551,37 @@ class BLEManager:
             return None
             
         try:
-            # 尝试获取信号强度
-            rssi = None
-            # BleakClient没有直接的rssi属性，所以我们直接使用扫描方式获取
-            
+            # 优先使用扫描器缓存的信号强度
+            rssi = self._cached_rssi()
+            if rssi is None and self._scanner is not None:
+                # 缓存过期时等待下一次广播
+                await asyncio.sleep(1.0)
+                rssi = self._cached_rssi()
+                
             if rssi is not None:
                 self.signal_strength = rssi
-                logging.debug(f"获取到设备 {self.device_address} 的信号强度: {rssi} dBm")
+                log.debug("获取到设备 %s 的信号强度: %s dBm", self.device_address, rssi)
                 return rssi
             
-            # 如果client没有rssi属性，尝试使用BleakScanner获取
-            scanner = BleakScanner()
-            await scanner.start()
-            await asyncio.sleep(1.0)  # 减少扫描时间以提高响应速度
-            
-            # 停止扫描并获取结果
-            devices = await scanner.get_discovered_devices()
-            await scanner.stop()
-            
-            # 查找匹配的设备
-            for device in devices:
-                if self.device_address and device.address and device.address.upper() == self.device_address.upper():
-                    self.signal_strength = device.rssi
-                    logging.debug(f"通过扫描获取到设备 {self.device_address} 的信号强度: {device.rssi} dBm")
-                    return device.rssi
+            # 扫描器未运行时，临时扫描一次
+            if self._scanner is None:
+                scanner = BleakScanner(detection_callback=self._on_advertisement, scanning_mode="active")
+                await scanner.start()
+                await asyncio.sleep(1.0)  # 减少扫描时间以提高响应速度
+                await scanner.stop()
+                rssi = self._cached_rssi()
+                if rssi is not None:
+                    self.signal_strength = rssi
+                    log.debug("通过扫描获取到设备 %s 的信号强度: %s dBm", self.device_address, rssi)
+                    return rssi
             
             # 如果没有找到设备
-            logging.warning(f"无法获取设备 {self.device_address} 的信号强度")
+            log.warning("无法获取设备 %s 的信号强度", self.device_address)
             return None
         except Exception as e:
-            logging.error(f"读取信号强度失败: {str(e)}")
+            log.error("读取信号强度失败: %s", e)
             return None
     
-    async def scan_devices(self):
-        """扫描可用的蓝牙设备
-        
-        Returns:
-            list: 设备列表，每个元素为(name, address)元组
-        """
-        try:
-            # 记录开始扫描的日志
-            self.signals.log_message.emit("开始扫描蓝牙设备...")
-            logging.info("开始扫描蓝牙设备")
-            
-            devices = await BleakScanner.discover()
-            result = []
-            
-            for device in devices:
-                name = device.name or "未知设备"
-                address = device.address
-                result.append((name, address))
-                logging.debug(f"发现设备: {name} ({address})")
-                
-            # 记录扫描结果的日志
-            self.signals.log_message.emit(f"扫描完成，发现 {len(result)} 个设备")
-            logging.info(f"蓝牙扫描完成，发现 {len(result)} 个设备")
-            
-            # 详细记录每个发现的设备
-            if result:
-                device_list = "\n".join([f"- {name} ({addr})" for name, addr in result])
-                logging.debug(f"发现的设备列表:\n{device_list}")
-                
-            return result
-        except Exception as e:
-            self.signals.log_message.emit(f"扫描设备失败: {str(e)}")
-            logging.error(f"扫描蓝牙设备失败: {str(e)}")
-            return []
-
     async def set_channel_strength(self, channel, strength):
         """设置通道强度
         
@@ -328,12 +603,8 @@ class BLEManager:
             # 更新当前强度
             self.current_strength[channel] = strength
             
-            # 编码并发送命令
-            data = ProtocolConverter.encode_pwm_ab2(
-                self.current_strength['A'], 
-                self.current_strength['B']
-            )
-            success = await self.send_command(BLE_CHAR_PWM_AB2, data)
+            # 发送命令，短时间内的多次设置合并为一次写入
+            success = await self._write_strength()
             
             if success:
                 self.signals.log_message.emit(f"已设置{channel}通道强度为{strength}")
@@ -346,7 +617,7 @@ class BLEManager:
             
         except Exception as e:
             self.signals.log_message.emit(f"设置通道强度失败: {str(e)}")
-            logging.error(f"设置通道强度失败: {str(e)}")
+            log.error("设置通道强度失败: %s", e)
             return False
             
     async def get_current_strength(self, channel):
@@ -403,42 +674,49 @@ class BLEManager:
             # 根据通道选择特征值UUID
             char_uuid = BLE_CHAR_PWM_A34 if channel == 'A' else BLE_CHAR_PWM_B34
             
-            # 处理每组波形参数
-            for i in range(len(freq_list)):
-                freq = freq_list[i]
-                intensity = intensity_list[i]
-                
+            # 先编码全部波形参数，发送循环中只需写入和等待
+            max_strength = self.max_strength[channel]
+            encode = ProtocolConverter.encode_pwm_channel
+            freq_to_v2 = ProtocolConverter.v3_freq_to_v2
+            intensity_to_z = ProtocolConverter.v3_intensity_to_v2_z
+            payloads = []
+            for freq, intensity in zip(freq_list, intensity_list):
                 # 确保参数在有效范围内
                 freq = max(10, min(1000, freq))
-                intensity = max(0, min(self.max_strength[channel], intensity))
+                intensity = max(0, min(max_strength, intensity))
                 
-                # 跳过强度为0的部分
+                # 强度为0的部分不发送，但仍占用一个发送间隔
                 if intensity == 0:
+                    payloads.append((freq, intensity, None))
                     continue
                     
-                # 将频率转换为V2协议的x和y参数
-                x, y = ProtocolConverter.v3_freq_to_v2(freq)
-                
-                # 将强度转换为V2协议的z参数
-                z = ProtocolConverter.v3_intensity_to_v2_z(intensity)
-                
-                # 编码并发送命令
-                data = ProtocolConverter.encode_pwm_channel(x, y, z)
-                success = await self.send_command(char_uuid, data)
-                
-                if not success:
-                    self.signals.log_message.emit(f"发送波形参数失败: 频率={freq}, 强度={intensity}")
-                    return False
+                # 将频率转换为V2协议的x和y参数，强度转换为z参数
+                x, y = freq_to_v2(freq)
+                payloads.append((freq, intensity, encode(x, y, intensity_to_z(intensity))))
+            
+            # 逐个发送命令，按截止时间而不是固定延迟控制节奏，写入耗时不会累积到波形时长中
+            loop = asyncio.get_running_loop()
+            deadline = loop.time()
+            for freq, intensity, data in payloads:
+                if data is not None:
+                    success = await self.send_command(char_uuid, data)
                     
-                # 短暂延迟，确保命令能被设备处理
-                await asyncio.sleep(0.05)
+                    if not success:
+                        self.signals.log_message.emit(f"发送波形参数失败: 频率={freq}, 强度={intensity}")
+                        return False
+                    
+                # 每组参数间隔0.05秒，确保命令能被设备处理
+                deadline += 0.05
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
                 
             self.signals.log_message.emit(f"已发送自定义波形到{channel}通道")
             return True
             
         except Exception as e:
             self.signals.log_message.emit(f"发送自定义波形失败: {str(e)}")
-            logging.error(f"发送自定义波形失败: {str(e)}")
+            log.error("发送自定义波形失败: %s", e)
             return False
             
     async def set_both_channels_strength(self, a_strength, b_strength):
@@ -460,9 +738,8 @@ class BLEManager:
             self.current_strength['A'] = a_strength
             self.current_strength['B'] = b_strength
             
-            # 编码并发送命令
-            data = ProtocolConverter.encode_pwm_ab2(a_strength, b_strength)
-            success = await self.send_command(BLE_CHAR_PWM_AB2, data)
+            # 发送命令，短时间内的多次设置合并为一次写入
+            success = await self._write_strength()
             
             if success:
                 self.signals.log_message.emit(f"已设置A通道强度为{a_strength}，B通道强度为{b_strength}")
@@ -475,7 +752,7 @@ class BLEManager:
             
         except Exception as e:
             self.signals.log_message.emit(f"设置通道强度失败: {str(e)}")
-            logging.error(f"设置通道强度失败: {str(e)}")
+            log.error("设置通道强度失败: %s", e)
             return False
             
     async def reset_device(self):
@@ -487,16 +764,14 @@ class BLEManager:
             bool: 命令是否发送成功
         """
         try:
-            # 设置所有通道强度为0
-            success1 = await self.set_both_channels_strength(0, 0)
-            
-            # 清空A通道波形队列
-            success2 = await self.clear_channel('A')
-            
-            # 清空B通道波形队列
-            success3 = await self.clear_channel('B')
-            
-            if success1 and success2 and success3:
+            # 设置所有通道强度为0，需要时同时清空A、B通道波形队列，三次写入并发进行
+            tasks = [self.set_both_channels_strength(0, 0)]
+            if self.clear_waves_on_reset:
+                tasks.append(self.clear_channel('A'))
+                tasks.append(self.clear_channel('B'))
+            results = await asyncio.gather(*tasks)
+            
+            if all(results):
                 self.signals.log_message.emit("设备已重置")
                 return True
             else:
@@ -505,7 +780,7 @@ class BLEManager:
                 
         except Exception as e:
             self.signals.log_message.emit(f"重置设备失败: {str(e)}")
-            logging.error(f"重置设备失败: {str(e)}")
+            log.error("重置设备失败: %s", e)
             return False
             
     async def get_device_info(self):
@@ -515,15 +790,17 @@ class BLEManager:
             dict: 设备信息字典
         """
         try:
-            # 获取设备ID
+            # 并发获取设备ID、电池电量和信号强度，耗时取决于最慢的一项
+            tasks = [self.read_battery(), self.read_signal_strength()]
             if not self.device_id:
-                await self.get_device_id()
-                
-            # 获取电池电量
-            battery = await self.read_battery()
+                tasks.append(self.get_device_id())
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # 获取信号强度
-            rssi = await self.read_signal_strength()
+            # 单项失败时记录错误，该项结果为None
+            for name, result in zip(('电池电量', '信号强度', '设备ID'), results):
+                if isinstance(result, Exception):
+                    log.error("获取%s失败: %s", name, result)
+            battery, rssi = (None if isinstance(r, Exception) else r for r in results[:2])
             
             # 组装设备信息
             device_info = {
@@ -540,7 +817,7 @@ class BLEManager:
             
         except Exception as e:
             self.signals.log_message.emit(f"获取设备信息失败: {str(e)}")
-            logging.error(f"获取设备信息失败: {str(e)}")
+            log.error("获取设备信息失败: %s", e)
             return {
                 'device_id': self.device_id,
                 'connected': self.is_connected,
@@ -558,25 +835,21 @@ class BLEManager:
             bool: 操作是否成功
         """
         if not self.is_connected:
-            logging.warning("尝试设置强度但设备未连接")
+            log.warning("尝试设置强度但设备未连接")
             return False
             
         try:
             # 验证强度范围
             max_strength = self.max_strength[channel]
             if strength < 0 or strength > max_strength:
-                logging.warning(f"强度值超出范围: {strength}, 最大值: {max_strength}")
+                log.warning("强度值超出范围: %s, 最大值: %s", strength, max_strength)
                 return False
                 
             # 更新当前强度属性
             self.current_strength[channel] = strength
             
-            # 编码并发送命令
-            data = ProtocolConverter.encode_pwm_ab2(
-                self.current_strength['A'], 
-                self.current_strength['B']
-            )
-            success = await self.send_command(BLE_CHAR_PWM_AB2, data)
+            # 发送命令，短时间内的多次设置合并为一次写入
+            success = await self._write_strength()
             
             if success:
                 self.signals.log_message.emit(f"已设置{channel}通道强度为{strength}")
@@ -589,7 +862,7 @@ class BLEManager:
             
         except Exception as e:
             self.signals.log_message.emit(f"设置通道强度失败: {str(e)}")
-            logging.error(f"设置通道强度失败: {str(e)}")
+            log.error("设置通道强度失败: %s", e)
             return False
             
     async def adjust_strength(self, channel, delta):
@@ -623,12 +896,12 @@ class BLEManager:
                 await self.set_strength(channel, new_strength)
                 # 发送状态更新消息
                 self.signals.log_message.emit(f"通道{channel}强度已调整：{current} -> {new_strength}")
-                logging.info(f"通道{channel}强度已调整：{current} -> {new_strength}")
+                log.info("通道%s强度已调整：%s -> %s", channel, current, new_strength)
         except Exception as e:
             # 错误处理
             error_msg = str(e)
             self.signals.log_message.emit(f"调整通道{channel}强度失败: {error_msg}")
-            logging.error(f"调整通道{channel}强度失败: {error_msg}")
+            log.error("调整通道%s强度失败: %s", channel, error_msg)
 
     async def clear_channel(self, channel):
         """清空指定通道的波形队列
@@ -656,5 +929,5 @@ class BLEManager:
             return True
         except Exception as e:
             self.signals.log_message.emit(f"清空通道{channel}波形队列失败: {str(e)}")
-            logging.error(f"清空通道{channel}波形队列失败: {str(e)}")
+            log.error("清空通道%s波形队列失败: %s", channel, e)
             return False
@@ -0,0 +1,144 @@
+import logging
+import asyncio
+import time
+from bleak import BleakScanner
+
+log = logging.getLogger(__name__)
+
+# 缓存的信号强度有效期(秒)，超过后重新等待广播数据
+RSSI_MAX_AGE = 5.0
+
+# 设备扫描时长(秒)，使用主动扫描可立即获得扫描响应，较短的时长即可发现附近设备
+SCAN_TIMEOUT = 3.0
+
+# 按地址查找已知设备时的最长扫描时长(秒)，找到设备后立即停止
+FIND_DEVICE_TIMEOUT = 5.0
+
+class BLEScannerMixin:        
+    """
+    蓝牙扫描功能混入类
+    
+    提供设备扫描、按地址查找设备，以及连接期间从广播数据中缓存信号强度的扫描器。
+    使用方需提供signals、device_address、_scanner和_rssi_cache属性
+    """
+    
+    def _on_advertisement(self, device, advertisement_data):
+        """扫描器回调：缓存设备的信号强度"""
+        if device.address:
+            self._rssi_cache[device.address.upper()] = (advertisement_data.rssi, time.monotonic())
+        
+    async def _start_scanner(self):
+        """启动用于获取信号强度的扫描器，失败时不影响连接"""
+        if self._scanner is not None:
+            return
+        try:
+            scanner = BleakScanner(detection_callback=self._on_advertisement, scanning_mode="active")
+            await scanner.start()
+            self._scanner = scanner
+        except Exception as e:
+            log.warning("启动信号强度扫描失败: %s", e)
+        
+    async def _stop_scanner(self):
+        """停止扫描器并清空信号强度缓存"""
+        scanner, self._scanner = self._scanner, None
+        self._rssi_cache.clear()
+        if scanner is None:
+            return
+        try:
+            await scanner.stop()
+        except Exception as e:
+            log.warning("停止信号强度扫描失败: %s", e)
+        
+    def _cached_rssi(self):
+        """返回有效期内缓存的当前设备信号强度，没有时返回None"""
+        if not self.device_address:
+            return None
+        cached = self._rssi_cache.get(self.device_address.upper())
+        if cached is None or time.monotonic() - cached[1] > RSSI_MAX_AGE:
+            return None
+        return cached[0]
+        
+    async def find_known_device(self, address, timeout=FIND_DEVICE_TIMEOUT):
+        """按地址查找已知设备，收到该设备的广播后立即停止扫描
+        
+        连接期间的扫描器正在运行时直接从其发现的设备中查找，不再启动第二个扫描器
+        
+        Args:
+            address (str): 设备MAC地址
+            timeout (float): 最长扫描时长(秒)
+            
+        Returns:
+            BLEDevice: 找到的设备，超时或失败时返回None
+        """
+        target = address.upper()
+        
+        if self._scanner is not None:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while True:
+                for device in self._scanner.discovered_devices:
+                    if device.address and device.address.upper() == target:
+                        return device
+                if self._scanner is None or loop.time() >= deadline:
+                    log.warning("未找到设备: %s", address)
+                    return None
+                await asyncio.sleep(0.2)
+                
+        found = asyncio.get_running_loop().create_future()
+        
+        def on_detect(device, advertisement_data):
+            if device.address and device.address.upper() == target and not found.done():
+                found.set_result(device)
+                
+        try:
+            scanner = BleakScanner(detection_callback=on_detect, scanning_mode="active")
+            await scanner.start()
+            try:
+                return await asyncio.wait_for(found, timeout)
+            except asyncio.TimeoutError:
+                log.warning("未找到设备: %s", address)
+                return None
+            finally:
+                await scanner.stop()
+        except Exception as e:
+            log.error("查找设备失败: %s, 错误=%s", address, e)
+            return None
+        
+    async def scan_devices(self):
+        """扫描可用的蓝牙设备
+        
+        Returns:
+            list: 设备列表，每个元素为(name, address)元组
+        """
+        try:
+            # 记录开始扫描的日志
+            self.signals.log_message.emit("开始扫描蓝牙设备...")
+            log.info("开始扫描蓝牙设备")
+            
+            # 连接期间扫描器已在运行，直接使用其发现的设备
+            if self._scanner is not None:
+                devices = self._scanner.discovered_devices
+            else:
+                devices = await BleakScanner.discover(timeout=SCAN_TIMEOUT, scanning_mode="active")
+            result = []
+            
+            for device in devices:
+                name = device.name or "未知设备"
+                address = device.address
+                result.append((name, address))
+                log.debug("发现设备: %s (%s)", name, address)
+                
+            # 记录扫描结果的日志
+            self.signals.log_message.emit(f"扫描完成，发现 {len(result)} 个设备")
+            log.info("蓝牙扫描完成，发现 %s 个设备", len(result))
+            
+            # 详细记录每个发现的设备
+            if result and log.isEnabledFor(logging.DEBUG):
+                device_list = "\n".join([f"- {name} ({addr})" for name, addr in result])
+                log.debug("发现的设备列表:\n%s", device_list)
+                
+            return result
+        except Exception as e:
+            self.signals.log_message.emit(f"扫描设备失败: {str(e)}")
+            log.error("扫描蓝牙设备失败: %s", e)
+            return []
@@ -3,6 +3,82 @@
 """
 
 import logging
+import re
+import struct
+from functools import lru_cache
+
+# 强度消息格式："strength-A+B+MAX"，前缀和最大强度可省略；
+# 与int()一致，各数值允许带符号和前后空白，最大强度之后的字段忽略
+_STRENGTH_RE = re.compile(
+    r'(?:strength-)?\s*([+-]?\d+)\s*\+\s*([+-]?\d+)\s*(?:\+\s*([+-]?\d+)\s*(?:\+.*)?)?',
+    re.DOTALL
+)
+
+# 3个无符号字节打包函数，避免bytes([...])创建中间列表
+_PACK3 = struct.Struct('<BBB').pack
+
+
+def _build_ab2(a_strength, b_strength):
+    """按V2协议计算PWM_AB2的3字节数据，仅用于构建查找表"""
+    # 根据郊狼官方V2蓝牙协议支持文档，PWM_AB2的格式是:
+    # 23-22bit(保留) 21-11bit(A通道实际强度) 10-0bit(B通道实际强度)
+    # 在APP中每增加一点强度是增加7(脉冲主机中设置的实际强度值为APP中显示值的7倍)
+    
+    # 将APP显示的强度值转换为实际强度值，确保不超过2047
+    a_actual = min(2047, a_strength * 7)
+    b_actual = min(2047, b_strength * 7)
+    
+    # 编码为3字节数据
+    # 第一个字节: B通道的低8位
+    byte1 = b_actual & 0xFF
+    
+    # 第二个字节: B通道的高3位 + A通道的低5位
+    byte2 = ((b_actual >> 8) & 0x07) | ((a_actual & 0x1F) << 3)
+    
+    # 第三个字节: A通道的高6位
+    byte3 = (a_actual >> 5) & 0x3F
+    
+    return _PACK3(byte1, byte2, byte3)
+
+
+def _build_freq_xy(freq):
+    """按V2协议公式计算V3频率值对应的(x, y)参数，仅用于构建查找表"""
+    # 根据V3协议文档中的频率转换公式计算实际频率(Hz)
+    if freq <= 100:
+        actual_freq = freq  # 10-100 -> 10-100Hz
+    elif freq <= 200:
+        actual_freq = (freq - 100) * 5 + 100  # 101-200 -> 105-600Hz
+    else:
+        actual_freq = (freq - 200) * 10 + 600  # 201-240 -> 610-1000Hz，更大的值沿用同一公式
+    
+    # 根据V2协议文档中的公式计算x和y
+    # X = ((Frequency / 1000)^ 0.5) * 15
+    # Y = Frequency - X
+    # 其中Frequency = X + Y = 1000 / actual_freq(波形周期ms)
+    
+    # 计算x值
+    x = int(((actual_freq / 1000.0) ** 0.5) * 15)
+    x = max(1, min(31, x))  # 确保x在1-31范围内
+    
+    # 计算y值
+    y = int(1000.0 / actual_freq - x)
+    y = max(1, min(1023, y))  # 确保y在1-1023范围内
+    
+    return (x, y)
+
+
+# PWM_AB2查找表：强度只有0-100共101种取值，导入时一次性算出全部组合，索引为 a*101+b
+_AB2_TABLE = tuple(_build_ab2(a, b) for a in range(101) for b in range(101))
+
+# 调用方传入的频率上限：V3协议频率为10-240，自定义波形和SOCKET数据可能传入更大的值
+_FREQ_MAX = 1000
+
+# V3频率(10-1000) -> (x, y)查找表，按频率值直接索引，0-9不会被使用
+_FREQ_XY = tuple(_build_freq_xy(max(10, f)) for f in range(_FREQ_MAX + 1))
+
+# V3强度(0-100) -> V2 z参数(0-31)查找表，线性映射
+_Z_TABLE = tuple(i * 31 // 100 for i in range(101))
+
 
 class ProtocolConverter:
     """协议转换工具类
@@ -23,69 +99,43 @@ class ProtocolConverter:
         Returns:
             bytes: 编码后的数据
         """
-        # 确保强度值在有效范围内
-        a_strength = max(0, min(100, a_strength))
-        b_strength = max(0, min(100, b_strength))
+        # 转换为整数并确保强度值在有效范围内，再直接查表；上游可能传入浮点数(如JSON数值)
+        a_strength = int(a_strength)
+        b_strength = int(b_strength)
+        a_strength = 0 if a_strength < 0 else 100 if a_strength > 100 else a_strength
+        b_strength = 0 if b_strength < 0 else 100 if b_strength > 100 else b_strength
+        return _AB2_TABLE[a_strength * 101 + b_strength]
         
-        # 根据郊狼官方V2蓝牙协议支持文档，PWM_AB2的格式是:
-        # 23-22bit(保留) 21-11bit(A通道实际强度) 10-0bit(B通道实际强度)
-        # 在APP中每增加一点强度是增加7(脉冲主机中设置的实际强度值为APP中显示值的7倍)
-        
-        # 将APP显示的强度值转换为实际强度值
-        a_actual = a_strength * 7
-        b_actual = b_strength * 7
-        
-        # 确保实际强度值不超过2047
-        a_actual = min(2047, a_actual)
-        b_actual = min(2047, b_actual)
-        
-        # 编码为3字节数据
-        # 第一个字节: B通道的低8位
-        byte1 = b_actual & 0xFF
-        
-        # 第二个字节: B通道的高3位 + A通道的低5位
-        byte2 = ((b_actual >> 8) & 0x07) | ((a_actual & 0x1F) << 3)
+    @staticmethod
+    def decode_pwm_ab2(data):
+        """解码PWM_AB2数据
         
-        # 第三个字节: A通道的高6位
-        byte3 = (a_actual >> 5) & 0x3F
+        将设备返回的3字节数据解码为A和B通道的APP显示强度
         
-        return bytes([byte1, byte2, byte3])
+        Args:
+            data (bytes): PWM_AB2的3字节数据
+            
+        Returns:
+            tuple: (A通道强度, B通道强度)
+        """
+        value = data[0] | (data[1] << 8) | (data[2] << 16)
+        # 21-11bit为A通道实际强度，10-0bit为B通道实际强度，实际强度为显示值的7倍
+        return ((value >> 11) & 0x7FF) // 7, (value & 0x7FF) // 7
         
     @staticmethod
     def v3_freq_to_v2(freq):
         """将V3协议的频率值转换为V2协议的x和y参数
         
         Args:
-            freq (int): V3协议的频率值(10-240)
+            freq (int): V3协议的频率值(10-240)，也接受至1000的值，超出10-1000时按边界值处理
             
         Returns:
             tuple: (x, y)参数
         """
-        # 根据V3协议文档中的频率转换公式计算实际频率(Hz)
-        if freq <= 100:
-            actual_freq = freq  # 10-100 -> 10-100Hz
-        elif freq <= 200:
-            actual_freq = (freq - 100) * 5 + 100  # 101-200 -> 105-600Hz
-        else:
-            actual_freq = (freq - 200) * 10 + 600  # 201-240 -> 610-1000Hz
-        
-        # 计算波形周期(ms)
-        period_ms = 1000.0 / actual_freq
-        
-        # 根据V2协议文档中的公式计算x和y
-        # X = ((Frequency / 1000)^ 0.5) * 15
-        # Y = Frequency - X
-        # 其中Frequency = X + Y = period_ms
-        
-        # 计算x值
-        x = int(((actual_freq / 1000.0) ** 0.5) * 15)
-        x = max(1, min(31, x))  # 确保x在1-31范围内
-        
-        # 计算y值
-        y = int(1000.0 / actual_freq - x)
-        y = max(1, min(1023, y))  # 确保y在1-1023范围内
-        
-        return (x, y)
+        # 转换为整数，频率超出10-1000时按边界值处理，再直接查表；上游可能传入浮点数
+        freq = int(freq)
+        freq = 10 if freq < 10 else _FREQ_MAX if freq > _FREQ_MAX else freq
+        return _FREQ_XY[freq]
     
     @staticmethod
     def v3_intensity_to_v2_z(intensity):
@@ -97,11 +147,10 @@ class ProtocolConverter:
         Returns:
             int: V2协议的z参数(0-31)
         """
-        # 确保强度值在有效范围内
-        intensity = max(0, min(100, intensity))
-        
-        # 线性映射到0-31范围
-        return int(intensity * 31 / 100)
+        # 转换为整数并确保强度值在有效范围内，再直接查表
+        intensity = int(intensity)
+        intensity = 0 if intensity < 0 else 100 if intensity > 100 else intensity
+        return _Z_TABLE[intensity]
     
     @staticmethod
     def encode_pwm_channel(x, y, z):
@@ -133,12 +182,8 @@ class ProtocolConverter:
         # 第三个字节: z的5位
         byte3 = z & 0x1F
         
-        # 确保所有字节都在0-255范围内
-        byte1 = max(0, min(255, byte1))
-        byte2 = max(0, min(255, byte2))
-        byte3 = max(0, min(255, byte3))
-        
-        return bytes([byte1, byte2, byte3])
+        # 经过掩码后各字节必然在0-255范围内，无需再次限制
+        return _PACK3(byte1, byte2, byte3)
     
     @staticmethod
     def decode_hex_wave_data(hex_string):
@@ -156,24 +201,19 @@ class ProtocolConverter:
                 hex_string = hex_string[2:]
                 
             # 确保字符串长度是偶数
-            if len(hex_string) % 2 != 0:
+            if len(hex_string) & 1:
                 hex_string = '0' + hex_string
                 
             # 将十六进制字符串转换为字节数组
-            byte_array = []
-            for i in range(0, len(hex_string), 2):
-                byte_value = int(hex_string[i:i+2], 16)
-                byte_array.append(byte_value)
-                
-            return bytes(byte_array)
+            return bytes.fromhex(hex_string)
         except ValueError as e:
-            raise ValueError(f"无效的十六进制数据: {hex_string}, 错误: {str(e)}")
+            raise ValueError(f"无效的十六进制数据: {hex_string}, 错误: {str(e)}") from e
     
     @staticmethod
     def parse_strength_message(message):
         """解析强度消息
         
-        解析格式为"strength-A+B+MAX"的强度消息
+        解析格式为"strength-A+B+MAX"的强度消息，忽略消息前后的空白（如换行符）
         
         Args:
             message (str): 强度消息字符串
@@ -181,31 +221,21 @@ class ProtocolConverter:
         Returns:
             dict: 解析后的强度数据
         """
-        result = {}
-        try:
-            # 移除前缀
-            if message.startswith('strength-'):
-                data = message[9:]
-            else:
-                data = message
-                
-            # 按+分割
-            parts = data.split('+')
-            if len(parts) >= 2:
-                result['A'] = int(parts[0])
-                result['B'] = int(parts[1])
-                
-                # 如果有最大强度信息
-                if len(parts) >= 3:
-                    result['A_max'] = int(parts[2])
-                    result['B_max'] = int(parts[2])
-                    
-            return result
-        except Exception as e:
-            logging.error(f"解析强度消息失败: {str(e)}")
+        # 一次匹配取出全部字段，格式不符时不会产生无效的整数转换
+        match = _STRENGTH_RE.fullmatch(message.strip())
+        if match is None:
+            logging.error(f"解析强度消息失败: {message}")
             return {'A': 0, 'B': 0}
+            
+        a_strength, b_strength, max_strength = match.groups()
+        result = {'A': int(a_strength), 'B': int(b_strength)}
+        # 如果有最大强度信息
+        if max_strength is not None:
+            result['A_max'] = result['B_max'] = int(max_strength)
+        return result
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_strength_message(a_strength, b_strength, a_max=100, b_max=100):
         """格式化强度消息
         
@@ -220,5 +250,6 @@ class ProtocolConverter:
         Returns:
             str: 格式化后的强度消息
         """
+        # 参数均为小整数，结果按参数缓存，强度不变时直接返回同一个字符串
         # 使用A通道的最大强度作为整体最大强度
         return f"strength-{a_strength}+{b_strength}+{a_max}"
\ No newline at end of file
@@ -1,7 +1,6 @@
 # 程序版本：Insidre-Previe-20250325-rc0
 import sys
 import os
-import json
 import logging
 import asyncio
 import qasync
@@ -11,11 +10,9 @@ from PySide6.QtWidgets import QApplication
 from config.settings import settings
 
 from ui.main_window import MainWindow
+from ui.styles import get_style
 # 导入setup_logging
 from utils.logger import setup_logging
-# 导入ProtocolConverter和常量
-from core.protocol.converter import ProtocolConverter
-from core.protocol.constants import BLE_CHAR_PWM_A34, BLE_CHAR_PWM_B34, BLE_CHAR_PWM_AB2
 
 def main():
     """应用程序主入口"""
@@ -25,54 +22,27 @@ def main():
     # 记录应用程序启动信息
     logging.info("=" * 50)
     logging.info("DG-LAB Controller Application Starting")
-    logging.info(f"Python Version: {sys.version}")
-    logging.info(f"Operating System: {os.name} - {sys.platform}")
+    logging.info("Python Version: %s", sys.version)
+    logging.info("Operating System: %s - %s", os.name, sys.platform)
     
-    # 确保配置文件存在并加载
-    config_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dg_lab_config.json')
-    logging.info(f"Config file path: {config_file}")
-    
-    # 加载配置文件
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_content = json.load(f)
-                logging.info(f"Config content: {config_content}")
-                
-                # 确保settings已经加载了配置文件
-                settings.load()  # 强制重新加载配置
-                
-                # 确认最大强度值已正确加载
-                logging.info(f"Loaded config, max strength: A={settings.max_strength_a}, B={settings.max_strength_b}")
-                
-                # 验证配置文件中的值与加载的值是否一致
-                if 'max_strength_a' in config_content and settings.max_strength_a != config_content['max_strength_a']:
-                    logging.warning(f"Max strength A mismatch: config={config_content['max_strength_a']}, settings={settings.max_strength_a}")
-                    
-                if 'max_strength_b' in config_content and settings.max_strength_b != config_content['max_strength_b']:
-                    logging.warning(f"Max strength B mismatch: config={config_content['max_strength_b']}, settings={settings.max_strength_b}")
-                    
-                # 验证语言设置
-                if 'language' in config_content:
-                    logging.info(f"Language setting in config: {config_content['language']}")
-        except Exception as e:
-            logging.error(f"Failed to read config file: {str(e)}")
+    # 配置文件已在导入settings时加载，这里直接使用其解析结果，不再重复读取
+    logging.info("Config file path: %s", settings.config_file)
+    config_content = settings.config_data
+    if config_content is not None:
+        # 完整配置内容只在DEBUG级别记录，字典仅在记录通过级别过滤后才格式化
+        logging.debug("Config content: %s", config_content)
+        logging.info("Loaded config, max strength: A=%s, B=%s", settings.max_strength_a, settings.max_strength_b)
+        logging.info("Language setting in config: %s", settings.language)
+    elif os.path.exists(settings.config_file):
+        logging.error("Failed to load config file, using default settings: %s", settings.config_file)
     else:
-        logging.warning(f"Config file not found: {config_file}")
+        logging.warning("Config file not found: %s", settings.config_file)
         
-    # 记录协议转换器测试
-    try:
-        test_freq = 100
-        x, y = ProtocolConverter.v3_freq_to_v2(test_freq)
-        test_intensity = 50
-        z = ProtocolConverter.v3_intensity_to_v2_z(test_intensity)
-        logging.info(f"Protocol conversion test: Frequency {test_freq}Hz -> x={x}, y={y}, Intensity {test_intensity}% -> z={z}")
-    except Exception as e:
-        logging.error(f"Protocol conversion test failed: {str(e)}")
-
     # 创建Qt应用
     app = QApplication(sys.argv)
     app.setApplicationName("DG-LAB Controller")
+    # 样式表设置在应用程序上，在创建窗口前设置，所有窗口共用一次解析结果
+    app.setStyleSheet(get_style(settings.accent_color))
     
     # 创建事件循环
     loop = qasync.QEventLoop(app)
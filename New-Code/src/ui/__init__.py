@@ -0,0 +1,32 @@
+"""
+界面模块
+
+不常用的对话框和图表组件按需导入，避免启动时加载
+"""
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .personalization import PersonalizationDialog
+    from .real_time_chart import RealTimeChart
+
+# 名称 -> (模块, 属性)
+_LAZY_IMPORTS = {
+    'PersonalizationDialog': ('ui.personalization', 'PersonalizationDialog'),
+    'RealTimeChart': ('ui.real_time_chart', 'RealTimeChart'),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        mod_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(mod_name), attr)
+    # 缓存到模块属性，后续访问不再经过 __getattr__
+    setattr(sys.modules[__name__], name, value)
+    return value
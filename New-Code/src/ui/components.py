@@ -2,6 +2,7 @@ from PySide6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QComboBox, QLineEdit
 )
+from PySide6.QtGui import QIntValidator
 import pyqtgraph as pg
 from utils.i18n import i18n
 
@@ -115,6 +116,7 @@ def create_strength_group():
     a_label = QLabel(i18n.translate("strength.channel_a_limit"))  # 确保使用正确的翻译键
     a_input = QLineEdit()
     a_input.setFixedWidth(100)
+    a_input.setValidator(QIntValidator(0, 200, a_input))
     
     a_layout.addWidget(a_label)
     a_layout.addWidget(a_input)
@@ -125,6 +127,7 @@ def create_strength_group():
     b_label = QLabel(i18n.translate("strength.channel_b_limit"))  # 确保使用正确的翻译键
     b_input = QLineEdit()
     b_input.setFixedWidth(100)
+    b_input.setValidator(QIntValidator(0, 200, b_input))
     
     b_layout.addWidget(b_label)
     b_layout.addWidget(b_input)
@@ -151,7 +154,7 @@ def create_wave_group():
     
     a_status = QLabel(i18n.translate("status.channel_a", "0", "0"))
     b_status = QLabel(i18n.translate("status.channel_b", "0", "0"))
-    battery_status = QLabel(i18n.translate("status.battery", "--"))
+    battery_status = QLabel(i18n.translate("status.battery_unknown"))
     signal_status = QLabel(i18n.translate("status.signal_unknown"))
     
     status_layout.addWidget(a_status)
@@ -159,32 +162,28 @@ def create_wave_group():
     status_layout.addWidget(battery_status)
     status_layout.addWidget(signal_status)
     
-    # 波形图
-    plot_layout = QHBoxLayout()
-    plot_layout.setSpacing(20)  # 增加波形图之间的间距
+    # 波形图：两个通道共用一个图形场景
+    wave_view = pg.GraphicsLayoutWidget()
+    wave_view.setMinimumHeight(250)  # 设置最小高度
+    wave_view.ci.layout.setHorizontalSpacing(20)  # 增加波形图之间的间距
     
     # A通道波形图
-    plot_a = pg.PlotWidget()
+    plot_a = wave_view.addPlot(row=0, col=0)
     plot_a.setTitle(i18n.translate("status.wave_title_a"))
     plot_a.setLabel('left', i18n.translate("status.wave_y_label"))
     plot_a.setLabel('bottom', i18n.translate("status.wave_x_label"))
     plot_a.showGrid(x=True, y=True)
-    plot_a.setMinimumHeight(250)  # 设置最小高度
     
     # B通道波形图
-    plot_b = pg.PlotWidget()
+    plot_b = wave_view.addPlot(row=0, col=1)
     plot_b.setTitle(i18n.translate("status.wave_title_b"))
     plot_b.setLabel('left', i18n.translate("status.wave_y_label"))
     plot_b.setLabel('bottom', i18n.translate("status.wave_x_label"))
     plot_b.showGrid(x=True, y=True)
-    plot_b.setMinimumHeight(250)  # 设置最小高度
-    
-    plot_layout.addWidget(plot_a)
-    plot_layout.addWidget(plot_b)
     
     layout.addLayout(status_layout)
-    layout.addLayout(plot_layout, 1)  # 添加拉伸因子，使波形图占据更多空间
+    layout.addWidget(wave_view, 1)  # 添加拉伸因子，使波形图占据更多空间
     
     group.setLayout(layout)
     
-    return group, a_status, b_status, battery_status, signal_status, plot_a, plot_b
\ No newline at end of file
+    return group, a_status, b_status, battery_status, signal_status, wave_view, plot_a, plot_b
\ No newline at end of file
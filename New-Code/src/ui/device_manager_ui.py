@@ -12,8 +12,20 @@ class DeviceManagerUI:
         self.ble_manager = main_window.ble_manager
         self.signals = main_window.signals
         self.device_scanner = None
+        self.update_status_texts()
         self.setup_connections()
         
+    def update_status_texts(self):
+        """缓存连接状态相关文本，语言切换时需重新调用"""
+        self._status_text_connected = i18n.translate("device.status", i18n.translate("device.connected"))
+        self._status_text_disconnected = i18n.translate("device.status", i18n.translate("device.disconnected"))
+        self._signal_text_unknown = i18n.translate("status.signal_unknown")
+        self._battery_text_unknown = i18n.translate("status.battery_unknown")
+        
+    def connection_status_text(self, connected):
+        """返回缓存的连接状态文本"""
+        return self._status_text_connected if connected else self._status_text_disconnected
+        
     def setup_connections(self):
         """设置信号连接"""
         # 设备扫描按钮
@@ -24,6 +36,12 @@ class DeviceManagerUI:
         self.signals.device_selected.connect(self.on_device_selected)
         # 连接状态变更信号
         self.signals.connection_changed.connect(self.on_connection_changed)
+        # 电池电量更新信号，来自定时读取或设备通知
+        self.signals.battery_update.connect(self.on_battery_update)
+        
+    def on_battery_update(self, battery_level):
+        """显示电池电量"""
+        self.main_window.battery_status.setText(i18n.translate("status.battery", battery_level))
         
     @asyncSlot()
     async def initialize_bluetooth_check(self):
@@ -102,13 +120,15 @@ class DeviceManagerUI:
     async def update_battery(self):
         """更新电池电量"""
         try:
-            if self.ble_manager.is_connected:
-                battery_level = await self.ble_manager.read_battery()
+            # 已订阅电池电量通知时由通知更新，只需在尚无电量时读取一次
+            ble_manager = self.ble_manager
+            if ble_manager.is_connected and (not ble_manager.battery_notifying
+                                             or ble_manager.battery_level is None):
+                battery_level = await ble_manager.read_battery()
                 if battery_level is not None:
-                    self.main_window.battery_status.setText(i18n.translate("status.battery", battery_level))
-                    self.signals.battery_update.emit(battery_level)
                     # 确保保存到BLEManager属性
-                    self.ble_manager.battery_level = battery_level
+                    ble_manager.battery_level = battery_level
+                    self.signals.battery_update.emit(battery_level)
         except Exception as e:
             self.signals.log_message.emit(i18n.translate("status_updates.battery_read_failed", str(e)))
             
@@ -168,7 +188,7 @@ class DeviceManagerUI:
     def on_connection_changed(self, connected):
         """处理连接状态变更"""
         if connected:
-            self.main_window.device_status.setText(i18n.translate("device.status", i18n.translate("device.connected")))
+            self.main_window.device_status.setText(self.connection_status_text(True))
             # 连接成功后立即更新一次状态
             QTimer.singleShot(0, self.update_battery)
             QTimer.singleShot(0, self.update_signal_strength)
@@ -181,10 +201,10 @@ class DeviceManagerUI:
                 logging.info("重新启动信号强度更新定时器")
                 self.main_window.signal_update_timer.start()
         else:
-            self.main_window.device_status.setText(i18n.translate("device.status", i18n.translate("device.disconnected")))
-            # 更新信号状态为未知
-            self.main_window.signal_status.setText(i18n.translate("status.signal_unknown"))
-            self.main_window.battery_status.setText(i18n.translate("status.battery", "--"))
+            self.main_window.device_status.setText(self.connection_status_text(False))
+            # 更新信号和电池状态为未知
+            self.main_window.signal_status.setText(self._signal_text_unknown)
+            self.main_window.battery_status.setText(self._battery_text_unknown)
             
             # 停止定时器
             if self.main_window.battery_update_timer.isActive():
@@ -6,12 +6,12 @@ from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 from utils.i18n import i18n
 from utils.async_utils import asyncSlot
-from .styles import get_style
+from .styles import BackgroundMixin
 from config.settings import settings  # 添加这一行导入settings模块
 import logging
 import pyqtgraph as pg  # 添加这一行导入pyqtgraph模块
 
-class DeviceScanner(QDialog):
+class DeviceScanner(BackgroundMixin, QDialog):
     def __init__(self, parent, ble_manager):
         super().__init__(parent)
         self.parent = parent
@@ -39,7 +39,7 @@ class DeviceScanner(QDialog):
         
         # 标题标签
         title_label = QLabel(i18n.translate("dialog.choose_device"))
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("dialogTitle")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -97,9 +97,7 @@ class DeviceScanner(QDialog):
         # 获取父窗口
         parent = self.parent
         
-        # 应用默认样式表
-        style = get_style("dark")  # 使用默认的深色主题
-        self.setStyleSheet(style)
+        # 样式表由应用程序统一设置，对话框无需单独设置
         
         # 更新波形图颜色
         if hasattr(self, 'plot_widget'):
@@ -111,25 +109,9 @@ class DeviceScanner(QDialog):
             self.plot_widget.getAxis('bottom').setPen(axis_pen)
             self.plot_widget.getAxis('left').setPen(axis_pen)
             
-        # 从父窗口获取主题设置
+        # 从父窗口获取背景图片，背景图片不在样式表中，需单独设置
         if parent and hasattr(parent, 'signals'):
-            # 尝试从父窗口获取颜色和背景图片
-            accent_color = "#7f744f"  # 默认值
-            background_image = ""
-            
-            if hasattr(parent, 'accent_color'):
-                accent_color = parent.accent_color
-                
-            if hasattr(parent, 'background_image'):
-                background_image = parent.background_image
-                
-            # 使用父窗口的样式
-            if hasattr(parent, 'styleSheet') and parent.styleSheet():
-                self.setStyleSheet(parent.styleSheet())
-            else:
-                # 否则使用默认样式
-                style_sheet = get_style(accent_color, background_image)
-                self.setStyleSheet(style_sheet)
+            self.set_background_image(getattr(parent, 'background_image', ""))
         
     @asyncSlot()
     async def start_scan(self):
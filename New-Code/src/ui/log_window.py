@@ -1,14 +1,14 @@
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QCloseEvent
-from datetime import datetime
+from PySide6.QtGui import QCloseEvent, QTextCursor
+from collections import deque
 from utils.i18n import i18n
-from .styles import get_style
+from .styles import BackgroundMixin
 import logging
 from utils.logger import log_emitter  # 导入日志信号发射器
 from config.settings import settings  # 导入settings
 
-class LogWindow(QMainWindow):
+class LogWindow(BackgroundMixin, QMainWindow):
     # 添加关闭信号
     window_closed = Signal()
     
@@ -28,14 +28,19 @@ class LogWindow(QMainWindow):
         
         # 添加标题标签
         title_label = QLabel(i18n.translate("log.title"))
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("dialogTitle")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # 日志文本区域
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
-        self.log_area.setStyleSheet("font-family: 'Consolas', monospace; font-size: 9pt;")
+        # 字体由共用样式表中的 QTextEdit#logArea 规则设置，不再为该控件单独设置样式表
+        self.log_area.setObjectName("logArea")
+        # 日志只追加不编辑，关闭撤销记录；限制最多保留的行数，避免长时间运行后内存持续增长
+        document = self.log_area.document()
+        document.setUndoRedoEnabled(False)
+        document.setMaximumBlockCount(5000)
         layout.addWidget(self.log_area)
         
         # 清除按钮
@@ -43,32 +48,51 @@ class LogWindow(QMainWindow):
         clear_btn.clicked.connect(self.clear_log)
         layout.addWidget(clear_btn)
         
-        # 初始化日志缓冲区和更新定时器
-        self.log_buffer = []
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.flush_log_buffer)
-        self.update_timer.setInterval(100)  # 每100ms更新一次
-        self.update_timer.start()
+        # 初始化日志缓冲区，缓冲区有上限，来不及显示时丢弃最旧的消息
+        self.log_buffer = deque(maxlen=1000)
+        # 有新日志时才安排一次延迟刷新，同一批突发日志合并为一次界面更新
+        self._flush_scheduled = False
         
-        # 连接日志信号
-        log_emitter.log_signal.connect(self.buffer_log)
+        # 日志信号只在窗口显示期间连接，见showEvent/hideEvent
+        self._log_connected = False
         
         # 应用样式
         self.apply_theme()
         
+    def showEvent(self, event):
+        """窗口显示时开始接收日志"""
+        super().showEvent(event)
+        if not self._log_connected:
+            log_emitter.log_signal.connect(self.buffer_log)
+            self._log_connected = True
+        
+    def hideEvent(self, event):
+        """窗口隐藏时停止接收日志，先显示缓冲区中剩余的消息"""
+        super().hideEvent(event)
+        if self._log_connected:
+            log_emitter.log_signal.disconnect(self.buffer_log)
+            self._log_connected = False
+        self.flush_log_buffer()
+        
     def buffer_log(self, message):
-        """将日志消息添加到缓冲区"""
-        try:
-            # 添加时间戳（如果消息中没有）
-            if not message.startswith('['):
-                timestamp = datetime.now().strftime('[%H:%M:%S]')
-                message = f"{timestamp} {message}"
-            
-            self.log_buffer.append(message)
+        """将日志消息添加到缓冲区
+        
+        消息由QtHandler的格式化器统一加上[HH:MM:SS]时间戳，这里直接使用
+        """
+        if not self.isVisible():
+            return
             
-        except Exception as e:
-            logging.error(f"添加日志到缓冲区失败: {str(e)}")
+        self.log_buffer.append(message)
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(50, self._do_flush)
             
+    def _do_flush(self):
+        """延迟刷新到期，清除标记后刷新缓冲区"""
+        self._flush_scheduled = False
+        self.flush_log_buffer()
+        
     def flush_log_buffer(self):
         """将缓冲区中的日志消息批量更新到UI"""
         if not self.log_buffer:
@@ -79,8 +103,14 @@ class LogWindow(QMainWindow):
             scrollbar = self.log_area.verticalScrollBar()
             was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 10
             
-            # 批量添加日志
-            self.log_area.append('\n'.join(self.log_buffer))
+            # 批量添加日志：在文档末尾一次插入纯文本，不经过append的富文本处理
+            document = self.log_area.document()
+            text = '\n'.join(self.log_buffer)
+            if not document.isEmpty():
+                text = '\n' + text
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
             
             # 只有在之前滚动条在底部时才自动滚动
             if was_at_bottom:
@@ -100,11 +130,18 @@ class LogWindow(QMainWindow):
         
     def closeEvent(self, event: QCloseEvent):
         """窗口关闭事件处理"""
-        self.update_timer.stop()  # 停止更新定时器
         self.window_closed.emit()
         logging.info("日志窗口已关闭")
         event.accept()
 
-    def apply_theme(self):
-        """应用主题样式"""
-        self.setStyleSheet(get_style(settings.accent_color, settings.background_image))
\ No newline at end of file
+    def apply_theme(self, accent_color=None, background_image=None):
+        """应用主题样式
+        
+        样式表由应用程序统一设置，这里只需更新背景图片
+        
+        Args:
+            accent_color: 强调色，仅保留以兼容现有调用
+            background_image: 背景图片路径，默认使用配置中的值
+        """
+        background_image = background_image or settings.background_image
+        self.set_background_image(background_image)
\ No newline at end of file
@@ -1,12 +1,10 @@
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QMessageBox, QGroupBox
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QEvent
 from qasync import asyncSlot
 import logging
-import sys
-import os
 import asyncio
 import json
 
@@ -24,15 +22,12 @@ from .components import (
 )
 from .device_manager_ui import DeviceManagerUI
 from .server_manager_ui import ServerManagerUI
-from .strength_manager_ui import StrengthManagerUI
+from .strength_manager_ui import StrengthManagerUI, StrengthLabel
 from .wave_manager_ui import WaveManagerUI
 from .log_window import LogWindow
-from .personalization import PersonalizationDialog
-from .styles import get_style
+from .styles import get_style, BackgroundMixin
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # 添加项目根目录到PATH
-
-class MainWindow(QMainWindow):
+class MainWindow(BackgroundMixin, QMainWindow):
     """主窗口类
     
     负责创建和管理应用程序的主界面，包括：
@@ -140,7 +135,7 @@ class MainWindow(QMainWindow):
         # 顶部标题栏
         self.title_layout = QHBoxLayout()
         title_label = QLabel(i18n.translate("main_title"))
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 15px;")
+        title_label.setObjectName("mainTitle")
         self.title_layout.addWidget(title_label)
         self.title_layout.addStretch()
         
@@ -159,11 +154,11 @@ class MainWindow(QMainWindow):
         self.device_group, self.device_label, self.scan_btn, self.connect_btn, self.device_status = create_device_group()
         self.server_group, self.server_input, self.server_save_btn, self.server_connect_btn = create_server_group()
         self.strength_group, self.a_limit_input, self.b_limit_input, self.save_strength_btn = create_strength_group()
-        self.wave_group, self.a_status, self.b_status, self.battery_status, self.signal_status, self.plot_widget_a, self.plot_widget_b = create_wave_group()
+        self.wave_group, self.a_status, self.b_status, self.battery_status, self.signal_status, self.wave_view, self.plot_widget_a, self.plot_widget_b = create_wave_group()
         
         # 强度显示标签
-        self.a_strength_label = QLabel('0%')
-        self.b_strength_label = QLabel('0%')
+        self.a_strength_label = StrengthLabel('A')
+        self.b_strength_label = StrengthLabel('B')
         self.wave_layout = QVBoxLayout()
         self.wave_layout.addWidget(QLabel(i18n.translate("status.strength_a")))
         self.wave_layout.addWidget(self.a_strength_label)
@@ -424,8 +419,8 @@ class MainWindow(QMainWindow):
             self.connect_btn.setText(i18n.translate("device.connect"))
             
             # 更新设备状态文本
-            status_text = i18n.translate("device.connected") if self.ble_manager.is_connected else i18n.translate("device.disconnected")
-            self.device_status.setText(i18n.translate("device.status", status_text))
+            self.device_manager.update_status_texts()
+            self.device_status.setText(self.device_manager.connection_status_text(self.ble_manager.is_connected))
             
             # 更新服务器配置组件
             self.server_save_btn.setText(i18n.translate("server.save"))
@@ -523,6 +518,8 @@ class MainWindow(QMainWindow):
     def show_personalization(self):
         """显示个性化设置对话框"""
         logging.info("打开个性化设置对话框")
+        # 个性化对话框不常用，首次打开时再导入
+        from .personalization import PersonalizationDialog
         dialog = PersonalizationDialog(self, self.accent_color, self.background_image)
         
         if dialog.exec():
@@ -557,8 +554,12 @@ class MainWindow(QMainWindow):
         """应用主题样式"""
         logging.info(f"开始应用主题 - 主题色: {self.accent_color}, 背景图: {self.background_image}")
         try:
-            style_sheet = get_style(self.accent_color, self.background_image)
-            self.setStyleSheet(style_sheet)
+            # 样式表设置在应用程序上，由所有窗口共用；内容未变化时不重新设置，避免全部控件重新应用样式
+            style_sheet = get_style(self.accent_color)
+            app = QApplication.instance()
+            if app.styleSheet() != style_sheet:
+                app.setStyleSheet(style_sheet)
+            self.set_background_image(self.background_image)
             # 更新波形图颜色
             if hasattr(self, 'wave_manager'):
                 self.wave_manager.apply_theme()
@@ -673,6 +674,27 @@ class MainWindow(QMainWindow):
             self.signals.log_message.emit(i18n.translate("status_updates.clear_channel_failed", channel, error_msg))
             logging.error(f"清除通道{channel}失败: {error_msg}")
     
+    def hideEvent(self, event):
+        """窗口隐藏时暂停波形重绘"""
+        if hasattr(self, 'wave_manager'):
+            self.wave_manager.pause_updates()
+        super().hideEvent(event)
+        
+    def showEvent(self, event):
+        """窗口显示时恢复波形重绘"""
+        if hasattr(self, 'wave_manager'):
+            self.wave_manager.resume_updates()
+        super().showEvent(event)
+        
+    def changeEvent(self, event):
+        """窗口最小化/还原时暂停或恢复波形重绘"""
+        if event.type() == QEvent.WindowStateChange and hasattr(self, 'wave_manager'):
+            if self.isMinimized():
+                self.wave_manager.pause_updates()
+            else:
+                self.wave_manager.resume_updates()
+        super().changeEvent(event)
+        
     def closeEvent(self, event):
         """窗口关闭事件处理"""
         logging.info("应用程序开始关闭...")
@@ -1,15 +1,14 @@
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QColorDialog, QFileDialog, QGroupBox,
     QSlider, QSpinBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QFileInfo
 from PySide6.QtGui import QColor
 from utils.i18n import i18n
-import os
-from .styles import get_style
+from .styles import get_style, BackgroundMixin
 
-class PersonalizationDialog(QDialog):
+class PersonalizationDialog(BackgroundMixin, QDialog):
     def __init__(self, parent=None, accent_color=None, background_image=None):
         super().__init__(parent)
         self.setWindowTitle(i18n.translate("personalization.title"))
@@ -18,7 +17,9 @@ class PersonalizationDialog(QDialog):
         
         # 保存当前设置
         self.accent_color = accent_color or "#7f744f"
+        self._qcolor = QColor(self.accent_color)  # 强调色的QColor形式，避免重复解析颜色字符串
         self.background_image = background_image or ""
+        self._bg_info = QFileInfo(self.background_image) if self.background_image else None
         
         # 创建布局
         layout = QVBoxLayout()
@@ -27,7 +28,7 @@ class PersonalizationDialog(QDialog):
         
         # 创建标题标签
         title_label = QLabel(i18n.translate("personalization.title"))
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("dialogTitle")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -39,7 +40,7 @@ class PersonalizationDialog(QDialog):
         preview_layout = QHBoxLayout()
         self.color_label = QLabel()
         self.color_label.setFixedSize(100, 30)  # 与旧版保持一致的预览大小
-        self.color_label.setStyleSheet(f"background-color: {self.accent_color}; border: 1px solid #999;")
+        self.color_label.setObjectName("colorSwatch")  # 颜色由样式表中的强调色决定
         
         self.color_value_label = QLabel(self.accent_color)
         preview_layout.addWidget(self.color_label)
@@ -67,7 +68,7 @@ class PersonalizationDialog(QDialog):
         # 当前背景路径显示
         bg_path_layout = QHBoxLayout()
         path_label = QLabel(i18n.translate("personalization.current_background"))
-        self.bg_label = QLabel(os.path.basename(self.background_image) if self.background_image else i18n.translate("personalization.no_background"))
+        self.bg_label = QLabel(self._bg_info.fileName() if self._bg_info else i18n.translate("personalization.no_background"))
         bg_path_layout.addWidget(path_label)
         bg_path_layout.addWidget(self.bg_label)
         bg_layout.addLayout(bg_path_layout)
@@ -105,53 +106,31 @@ class PersonalizationDialog(QDialog):
         self.apply_theme()
         
     def choose_color(self):
-        # 创建自定义颜色对话框
-        color_dialog = QColorDialog(QColor(self.accent_color), self)
-        # 设置对话框标题
-        color_dialog.setWindowTitle(i18n.translate("dialog.choose_color"))
-        # 禁用Alpha通道
-        color_dialog.setOption(QColorDialog.ShowAlphaChannel, False)
-        
-        # 使用自定义对话框而非原生对话框
-        color_dialog.setOption(QColorDialog.DontUseNativeDialog, True)
-        
-        # 获取对话框中的按钮并设置文本
-        buttons = color_dialog.findChildren(QPushButton)
-        for button in buttons:
-            if button.text() == "OK" or button.text() == "&OK":
-                button.setText(i18n.translate("dialog.ok"))
-            elif button.text() == "Cancel" or button.text() == "&Cancel":
-                button.setText(i18n.translate("dialog.cancel"))
-        
-        if color_dialog.exec():
-            self.accent_color = color_dialog.selectedColor().name()
-            self.color_label.setStyleSheet(f"background-color: {self.accent_color}; border: 1px solid #999;")
+        # 使用系统原生颜色对话框，按钮文本由系统本地化
+        color = QColorDialog.getColor(self._qcolor, self, i18n.translate("dialog.choose_color"))
+        
+        if color.isValid():
+            self._qcolor = color
+            self.accent_color = self._qcolor.name()
             self.color_value_label.setText(self.accent_color)
+            # 以新颜色重新应用一次对话框样式表，预览块随之更新
+            self.apply_theme()
             
     def choose_background(self):
-        # 创建自定义文件对话框
-        file_dialog = QFileDialog(self)
-        file_dialog.setWindowTitle(i18n.translate("dialog.choose_image"))
-        file_dialog.setNameFilter("Images (*.png *.jpg *.jpeg *.bmp)")
-        file_dialog.setFileMode(QFileDialog.ExistingFile)
-        
-        # 使用自定义对话框而非原生对话框
-        file_dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-        
-        # 设置按钮文本
-        buttons = file_dialog.findChildren(QPushButton)
-        for button in buttons:
-            if button.text() == "Open" or button.text() == "&Open":
-                button.setText(i18n.translate("dialog.ok"))
-            elif button.text() == "Cancel" or button.text() == "&Cancel":
-                button.setText(i18n.translate("dialog.cancel"))
-        
-        if file_dialog.exec():
-            selected_files = file_dialog.selectedFiles()
-            if selected_files:
-                file_path = selected_files[0]
-                self.background_image = file_path
-                self.bg_label.setText(os.path.basename(file_path))
+        # 使用系统原生文件对话框
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            i18n.translate("dialog.choose_image"),
+            "",
+            "Images (*.png *.jpg *.jpeg *.bmp)"
+        )
+        
+        if file_path:
+            self.background_image = file_path
+            self._bg_info = QFileInfo(file_path)
+            self.bg_label.setText(self._bg_info.fileName())
+            # 仅在选择新图片时重新加载背景
+            self.set_background_image(file_path)
             
     def get_settings(self):
         return {
@@ -164,6 +143,15 @@ class PersonalizationDialog(QDialog):
         # 获取父窗口的样式设置
         parent = self.parent()
         if parent:
-            # 使用当前设置的颜色和背景
-            style_sheet = get_style(self.accent_color, self.background_image)
-            self.setStyleSheet(style_sheet)
\ No newline at end of file
+            # 颜色和背景均未变化时无需重新应用样式表
+            key = (self.accent_color, self.background_image)
+            if key == getattr(self, '_last_theme', None):
+                return
+            self._last_theme = key
+            
+            # 应用程序已设置当前主题的样式表，只有预览其他颜色时才为对话框单独设置
+            style_sheet = get_style(self.accent_color)
+            if style_sheet == QApplication.instance().styleSheet():
+                style_sheet = ""
+            self.setStyleSheet(style_sheet)
+            self.set_background_image(self.background_image)
\ No newline at end of file
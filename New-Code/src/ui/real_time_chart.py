@@ -1,26 +1,62 @@
-import pyqtgraph as pg
-import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QPixmap, QImage
 from config.settings import settings
-import os
+import importlib.util
+import logging
+from pathlib import Path
+
+# 是否可使用OpenGL加速绘制（需要安装PyOpenGL）
+_HAS_OPENGL = importlib.util.find_spec('OpenGL') is not None
+
+# 预先创建的画笔，避免每次应用主题时重复解析颜色字符串
+# pyqtgraph 在首次创建图表时才导入，画笔随之延迟创建
+_PENS = {}
+
+def _get_pens():
+    """返回 (坐标轴画笔, 数据线画笔)"""
+    if not _PENS:
+        import pyqtgraph as pg
+        _PENS['axis'] = pg.mkPen(color='#888888', width=1)
+        _PENS['data'] = pg.mkPen(color='#00FF00', width=2)
+    return _PENS['axis'], _PENS['data']
+
+# Logo图片路径，仅在模块加载时解析和检查一次
+_LOGO_PATH = Path(__file__).resolve().parents[2] / 'assets' / 'dg_lab_logo.png'
+_LOGO_EXISTS = _LOGO_PATH.is_file()
+
+# Logo图像缓存，按 (图片路径, 宽, 高) 索引，多个图表共用一次解码结果
+_LOGO_CACHE = {}
 
 class RealTimeChart(QWidget):
     def __init__(self, parent=None, channel='A'):
         super().__init__(parent)
         self.channel = channel
+        # X轴数据缓存，按数据长度复用
+        self._x_cache = {}
+        # 背景Logo图像项，添加后不再重复创建
+        self._logo_item = None
+        # 当前降采样倍数
+        self._ds = 1
         self.setup_ui()
         # 确保初始化后立即清除数据
         self.clear_data()
         
     def setup_ui(self):
         """设置UI组件"""
+        import pyqtgraph as pg
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
         # 创建绘图窗口
         self.plot_widget = pg.PlotWidget()
+        # 有PyOpenGL时使用GPU绘制，失败则保持软件绘制
+        if _HAS_OPENGL:
+            try:
+                self.plot_widget.useOpenGL(True)
+            except Exception as e:
+                logging.warning(f"启用OpenGL绘制失败，使用软件绘制: {str(e)}")
         layout.addWidget(self.plot_widget)
         
         # 设置图表属性
@@ -35,13 +71,23 @@ class RealTimeChart(QWidget):
         view_box.setMouseMode(pg.ViewBox.RectMode)
         view_box.setMouseEnabled(x=False, y=False)
         view_box.enableAutoRange(enable=False)
+        # 隐藏自动缩放按钮，只绘制可见范围内的数据
+        self.plot_widget.hideButtons()
+        self.plot_widget.setClipToView(True)
+        
+        # 禁用坐标轴交互，只需设置一次
+        for name in ('left', 'bottom'):
+            axis = self.plot_widget.getAxis(name)
+            axis.setStyle(tickTextOffset=10)
+            axis.mouseDragEvent = lambda *args: None
         
         # 应用主题
         self.apply_theme()
         
         # 创建数据线
-        pen = pg.mkPen(color='#00FF00', width=2)
-        self.data_line = self.plot_widget.plot([], [], pen=pen)
+        # 数据均为有限值，跳过逐帧的有限性检查
+        self.data_line = self.plot_widget.plot([], [], pen=_get_pens()[1], skipFiniteCheck=True,
+                                               connect='all', autoDownsample=False, antialias=False)
         
         # 设置Y轴范围
         self.plot_widget.setYRange(0, 100)
@@ -51,23 +97,41 @@ class RealTimeChart(QWidget):
             self.plot_widget.setXRange(0, 100)
         else:  # B通道
             self.plot_widget.setXRange(0, 100)  # 时间范围
-            
-        # 添加DG-LAB Logo作为背景
-        self.add_background_logo()
+    
+    def showEvent(self, event):
+        """首次显示时添加背景Logo，此时布局已确定图表的实际尺寸"""
+        super().showEvent(event)
+        if self._logo_item is None:
+            # 等待本轮布局完成后再读取图表尺寸
+            QTimer.singleShot(0, self.add_background_logo)
     
     def add_background_logo(self):
         """添加DG-LAB Logo作为背景"""
+        # Logo不存在或已添加时直接返回
+        if not _LOGO_EXISTS or self._logo_item is not None:
+            return
+        
+        import pyqtgraph as pg
         # 创建一个图像项
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'dg_lab_logo.png')
-        if os.path.exists(logo_path):
-            logo_item = pg.ImageItem()
-            logo_img = QImage(logo_path)
-            logo_item.setImage(logo_img)
-            # 设置图像位置和大小
-            logo_item.setZValue(-100)  # 确保在数据线后面
-            logo_item.setOpacity(0.2)  # 设置透明度
-            # 添加到图表
-            self.plot_widget.addItem(logo_item)
+        logo_item = pg.ImageItem()
+        # 按图表尺寸等比缩放并缓存，避免每个图表重复解码
+        width, height = self.plot_widget.width(), self.plot_widget.height()
+        key = (str(_LOGO_PATH), width, height)
+        logo_img = _LOGO_CACHE.get(key)
+        if logo_img is None:
+            image = QImage(str(_LOGO_PATH)).scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation)
+            # 转换为按RGBA顺序存储的非预乘格式，与ImageItem对数据的解释一致
+            image = image.convertToFormat(QImage.Format_RGBA8888)
+            logo_img = pg.functions.imageToArray(image, copy=True)
+            _LOGO_CACHE[key] = logo_img
+        # 图像为固定的RGBA数据，跳过自动色阶计算
+        logo_item.setImage(logo_img, autoLevels=False)
+        # 设置图像位置和大小
+        logo_item.setZValue(-100)  # 确保在数据线后面
+        logo_item.setOpacity(0.2)  # 设置透明度
+        # 添加到图表
+        self.plot_widget.addItem(logo_item)
+        self._logo_item = logo_item
     
     def update_data(self, data):
         """更新图表数据
@@ -76,11 +140,22 @@ class RealTimeChart(QWidget):
             data: 新的数据点列表
         """
         if data and len(data) > 0:
-            # 创建X轴数据
-            x = np.linspace(0, 100, len(data))
+            # 获取对应长度的X轴数据，首次出现的长度才创建
+            n = len(data)
+            x = self._x_cache.get(n)
+            if x is None:
+                import numpy as np
+                x = np.linspace(0, 100, n, dtype=np.float32)
+                self._x_cache[n] = x
+            
+            # 数据点多于图表像素宽度时按峰值降采样，绘制点数不超过像素宽度
+            ds = max(1, n // max(1, self.plot_widget.width()))
+            if ds != self._ds:
+                self._ds = ds
+                self.data_line.setDownsampling(ds=ds, auto=False, method='peak')
             
             # 更新图表
-            self.data_line.setData(x, data)
+            self.data_line.setData(x=x, y=data, skipFiniteCheck=True)
     
     def clear_data(self):
         """清除图表数据"""
@@ -88,19 +163,20 @@ class RealTimeChart(QWidget):
     
     def apply_theme(self):
         """应用图表主题"""
+        # 图表主题颜色固定，只需应用一次
+        if getattr(self, '_theme_applied', False):
+            return
+        self._theme_applied = True
+        
         # 设置图表样式
         self.plot_widget.setBackground('#2D2D30')  # 深色背景
         
-        # 设置坐标轴样式
-        axis_pen = pg.mkPen(color='#888888', width=1)
-        self.plot_widget.getAxis('left').setPen(axis_pen)
-        self.plot_widget.getAxis('bottom').setPen(axis_pen)
-        
-        # 禁用坐标轴交互
-        self.plot_widget.getAxis('left').setStyle(tickTextOffset=10)
-        self.plot_widget.getAxis('bottom').setStyle(tickTextOffset=10)
-        self.plot_widget.getAxis('left').mouseDragEvent = lambda *args: None
-        self.plot_widget.getAxis('bottom').mouseDragEvent = lambda *args: None
+        # 设置坐标轴样式，轴线和刻度文字共用同一支画笔
+        axis_pen = _get_pens()[0]
+        for name in ('left', 'bottom'):
+            axis = self.plot_widget.getAxis(name)
+            axis.setPen(axis_pen)
+            axis.setTextPen(axis_pen)
         
         # 设置网格样式
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
\ No newline at end of file
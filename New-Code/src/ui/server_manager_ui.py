@@ -12,8 +12,41 @@ class ServerManagerUI:
         self.main_window = main_window
         self.socket_manager = main_window.socket_manager
         self.signals = main_window.signals
+        # 最近一次保存的服务器地址，地址未变化时无需重复写入配置文件
+        self._last_addr = settings.socket_uri
         self.setup_connections()
         
+    def _normalize_address(self):
+        """读取并规范化输入框中的服务器地址
+        
+        Returns:
+            str: 以ws://或wss://开头的地址，输入为空时返回None
+        """
+        raw = self.main_window.server_input.text()
+        address = raw.strip()
+        if not address:
+            self.signals.log_message.emit(i18n.translate("status_updates.server_address_empty"))
+            return None
+            
+        # 验证WebSocket URL格式，要求以ws://或wss://开头
+        if not address.startswith(('ws://', 'wss://')):
+            address = 'ws://' + address
+            logging.info("添加ws://前缀: %s", address)
+            
+        # 只有地址被修改时才更新输入框，避免无谓的重绘和信号
+        if raw != address:
+            self.main_window.server_input.setText(address)
+        return address
+        
+    def _save_address(self, address):
+        """保存服务器地址到设置，与上次保存的地址相同时跳过"""
+        if address == self._last_addr:
+            return
+        settings.socket_uri = address
+        # 保存失败时不记录，下次保存同一地址时重新写入
+        if settings.save():
+            self._last_addr = address
+        
     def setup_connections(self):
         """设置信号连接"""
         # 保存服务器地址按钮
@@ -23,55 +56,36 @@ class ServerManagerUI:
         
     def save_server_address(self):
         """保存服务器地址"""
-        address = self.main_window.server_input.text().strip()
-        
-        if not address:
-            self.signals.log_message.emit(i18n.translate("status_updates.server_address_empty"))
+        address = self._normalize_address()
+        if address is None:
             return
-            
-        # 验证WebSocket URL格式
-        # 要求以ws://或wss://开头
-        if not address.startswith(('ws://', 'wss://')):
-            address = 'ws://' + address
-            logging.info(f"添加ws://前缀: {address}")
-            self.main_window.server_input.setText(address)
         
         # 保存到设置
-        settings.socket_uri = address
-        settings.save()
+        self._save_address(address)
         
         self.signals.log_message.emit(i18n.translate("status_updates.server_address_saved"))
-        logging.info(f"服务器地址已保存: {address}")
+        logging.info("服务器地址已保存: %s", address)
         
     @asyncSlot()
     async def connect_server(self):
         """连接到服务器"""
-        address = self.main_window.server_input.text().strip()
-        
-        if not address:
-            self.signals.log_message.emit(i18n.translate("status_updates.server_address_empty"))
+        address = self._normalize_address()
+        if address is None:
             logging.warning("尝试连接服务器但地址为空")
             return
-            
-        # 验证WebSocket URL格式
-        if not address.startswith(('ws://', 'wss://')):
-            address = 'ws://' + address
-            logging.info(f"添加ws://前缀: {address}")
-            self.main_window.server_input.setText(address)
         
         # 尝试连接
         self.signals.log_message.emit(i18n.translate("status_updates.connecting_to_server", address))
-        logging.info(f"正在连接服务器: {address}")
+        logging.info("正在连接服务器: %s", address)
         
         # 连接到服务器
         success = await self.socket_manager.connect(address)
         
         if success:
             self.signals.log_message.emit(i18n.translate("status_updates.server_connected"))
-            logging.info(f"服务器连接成功: {address}")
+            logging.info("服务器连接成功: %s", address)
             # 保存成功的地址
-            settings.socket_uri = address
-            settings.save()
+            self._save_address(address)
         else:
             self.signals.log_message.emit(i18n.translate("status_updates.server_connection_failed"))
-            logging.error(f"服务器连接失败: {address}")
\ No newline at end of file
+            logging.error("服务器连接失败: %s", address)
\ No newline at end of file
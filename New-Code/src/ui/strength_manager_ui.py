@@ -1,10 +1,61 @@
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QMessageBox, QLabel
+from PySide6.QtCore import Qt, QTimer, QSize
+from PySide6.QtGui import QPainter
 from qasync import asyncSlot
 import asyncio
 import logging
 from utils.i18n import i18n
 from config.settings import settings
 
+class StrengthLabel(QLabel):
+    """强度显示标签
+    
+    数值变化时只重绘自身，不调用setText，避免触发尺寸和布局的重新计算
+    """
+    
+    def __init__(self, prefix, parent=None):
+        self._prefix = prefix
+        self._text = f"{prefix}: 0/0"
+        super().__init__(self._text, parent)
+        # 以最长的显示内容作为尺寸参考，之后数值变化不影响布局
+        self._sizing_text = f"{prefix}: 200/200"
+        self.setAccessibleName(self._text)
+        
+    def text(self):
+        """返回当前显示的文本"""
+        return self._text
+        
+    def setValue(self, current, maximum):
+        """设置当前强度和最大强度"""
+        self._text = f"{self._prefix}: {current}/{maximum}"
+        # 辅助功能名称随数值更新，读屏软件读到的是实际强度
+        self.setAccessibleName(self._text)
+        self.update()
+        
+    def sizeHint(self):
+        """按最长的显示内容计算尺寸，包含样式表的内边距和边距"""
+        metrics = self.fontMetrics()
+        margins = self.contentsMargins()
+        extra = 2 * self.margin()
+        return QSize(
+            metrics.horizontalAdvance(self._sizing_text) + margins.left() + margins.right() + extra,
+            metrics.height() + margins.top() + margins.bottom() + extra
+        )
+        
+    def minimumSizeHint(self):
+        return self.sizeHint()
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        # 只在内容区域内绘制，保留样式表设置的内边距和边距
+        rect = self.contentsRect()
+        margin = self.margin()
+        if margin:
+            rect = rect.adjusted(margin, margin, -margin, -margin)
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, self._text)
+        painter.end()
+
 class StrengthManagerUI:
     """强度管理UI逻辑"""
     
@@ -12,6 +63,17 @@ class StrengthManagerUI:
         self.main_window = main_window
         self.ble_manager = main_window.ble_manager
         self.signals = main_window.signals
+        # 输入框中已通过校验的强度上限，输入不完整时为None
+        self._pending_limits = {'A': None, 'B': None}
+        # 上次显示的强度值，未变化时跳过标签更新
+        self._last = None
+        # 合并短时间内的多次强度变更，最多每33ms刷新一次显示
+        self._pending = QTimer(self.main_window)
+        self._pending.setSingleShot(True)
+        self._pending.setInterval(33)
+        self._pending.timeout.connect(self.update_strength_display)
+        # 正在执行的保存任务，同一时间只允许一个
+        self._save_task = None
         self.setup_connections()
         self.load_strength_settings()
         
@@ -20,17 +82,40 @@ class StrengthManagerUI:
         # 使用asyncSlot保存强度设置按钮
         # 修改这里，使用正确的方式连接异步槽函数
         self.main_window.save_strength_btn.clicked.connect(self.on_save_strength_clicked)
+        # 输入变化时缓存校验通过的数值
+        self.main_window.a_limit_input.textChanged.connect(lambda text: self.on_limit_text_changed('A', text))
+        self.main_window.b_limit_input.textChanged.connect(lambda text: self.on_limit_text_changed('B', text))
         # 强度变更信号
-        self.signals.strength_changed.connect(self.update_strength_display)
+        self.signals.strength_changed.connect(self._schedule_update)
+        
+    def _schedule_update(self):
+        """安排一次强度显示刷新，已有待执行的刷新时不重复安排"""
+        if not self._pending.isActive():
+            self._pending.start()
         
     # 添加这个方法作为中间处理函数
     def on_save_strength_clicked(self):
         """保存按钮点击处理函数"""
-        asyncio.create_task(self.save_strength_settings())
+        # 上一次保存尚未完成时忽略重复点击
+        if self._save_task and not self._save_task.done():
+            return
+        # save_strength_settings经asyncSlot包装后可能已返回任务，使用ensure_future兼容两种情况
+        self._save_task = asyncio.ensure_future(self.save_strength_settings())
+        self.main_window.save_strength_btn.setEnabled(False)
+        self._save_task.add_done_callback(self._on_save_finished)
         # 添加日志，确认按钮点击被处理
         logging.info("保存强度设置按钮被点击")
         self.signals.log_message.emit("正在保存强度设置...")
         
+    def on_limit_text_changed(self, channel, text):
+        """强度上限输入变化处理，仅在校验器判定可接受时缓存数值"""
+        line_edit = self.main_window.a_limit_input if channel == 'A' else self.main_window.b_limit_input
+        self._pending_limits[channel] = int(text) if line_edit.hasAcceptableInput() else None
+        
+    def _on_save_finished(self, task):
+        """保存任务结束后恢复保存按钮"""
+        self.main_window.save_strength_btn.setEnabled(True)
+        
     def load_strength_settings(self):
         """加载强度设置"""
         # 从设置加载最大强度
@@ -51,13 +136,13 @@ class StrengthManagerUI:
     async def save_strength_settings(self):
         """保存强度设置"""
         try:
-            # 获取当前设置的值
-            a_max = int(self.main_window.a_limit_input.text())
-            b_max = int(self.main_window.b_limit_input.text())
+            # 获取已通过QIntValidator(0, 200)校验的值
+            a_max = self._pending_limits['A']
+            b_max = self._pending_limits['B']
             
-            # 验证输入值
-            if a_max < 0 or a_max > 200 or b_max < 0 or b_max > 200:
-                self.signals.log_message.emit("强度值必须在0-200范围内")
+            if a_max is None or b_max is None:
+                self.main_window.signals.log_message.emit("请输入有效的数字")
+                logging.error("保存强度设置失败: 输入的不是有效数字")
                 return False
             
             # 更新BLE管理器的最大强度设置
@@ -68,11 +153,15 @@ class StrengthManagerUI:
             self.main_window.socket_manager.max_strength['A'] = a_max
             self.main_window.socket_manager.max_strength['B'] = b_max
             
+            # 通知界面刷新强度显示和波形范围
+            self.signals.strength_changed.emit()
+            
             # 更新设置对象
             settings.max_strength_a = a_max
             settings.max_strength_b = b_max
             
-            # 保存设置到文件
+            # 保存设置到文件；配置文件只有几百字节，在界面线程中写入，
+            # 避免与切换语言、保存服务器地址时的写入并发而损坏文件
             settings.save()
             
             # 记录日志
@@ -82,18 +171,17 @@ class StrengthManagerUI:
             # 如果Socket已连接，发送更新到服务器
             if self.main_window.socket_manager.is_connected:
                 try:
-                    # 发送强度更新
-                    await self.main_window.socket_manager.send_strength_update()
+                    # 发送强度更新，服务器响应过慢时放弃等待
+                    await asyncio.wait_for(self.main_window.socket_manager.send_strength_update(), 2.0)
                     self.main_window.signals.log_message.emit("已发送强度更新到服务器")
+                except asyncio.TimeoutError:
+                    self.main_window.signals.log_message.emit("发送强度更新到服务器超时")
+                    logging.warning("发送强度更新到服务器超时")
                 except Exception as e:
                     self.main_window.signals.log_message.emit(f"发送强度更新到服务器失败: {str(e)}")
                     logging.error(f"发送强度更新到服务器失败: {str(e)}")
             
             return True
-        except ValueError:
-            self.main_window.signals.log_message.emit("请输入有效的数字")
-            logging.error("保存强度设置失败: 输入的不是有效数字")
-            return False
         except Exception as e:
             self.main_window.signals.log_message.emit(f"保存强度设置失败: {str(e)}")
             logging.error(f"保存强度设置失败: {str(e)}")
@@ -110,9 +198,15 @@ class StrengthManagerUI:
             a_max = self.ble_manager.max_strength['A']
             b_max = self.ble_manager.max_strength['B']
             
+            # 数值未变化时不重复设置文本
+            current = (a_strength, a_max, b_strength, b_max)
+            if current == self._last:
+                return
+            self._last = current
+            
             # 更新UI显示
-            self.main_window.a_strength_label.setText(f"A: {a_strength}/{a_max}")
-            self.main_window.b_strength_label.setText(f"B: {b_strength}/{b_max}")
+            self.main_window.a_strength_label.setValue(a_strength, a_max)
+            self.main_window.b_strength_label.setValue(b_strength, b_max)
             
             # 记录日志
             logging.debug(f"更新强度显示: A={a_strength}/{a_max}, B={b_strength}/{b_max}")
@@ -1,50 +1,29 @@
 import os  # 导入os模块，用于处理文件路径和检查文件是否存在
+from functools import lru_cache
+from PySide6.QtGui import QPainter, QPixmap
 
-def get_style(accent_color, background_image=None):
-    """
-    获取应用样式表
-    
-    参数:
-        accent_color: 强调色，用于按钮等UI元素
-        background_image: 可选，背景图片路径。如果未提供，将使用默认背景
-    
-    返回:
-        str: 包含完整Qt样式表的字符串
-    """
-    # 设置默认背景图片路径，指向src目录下的background.png
-    DEFAULT_BACKGROUND = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),  # 获取当前文件所在目录(ui)的父目录(src)
-        'background.png'
-    )
-    # 如果未提供背景图片且默认背景图片存在，则使用默认背景
-    if not background_image and os.path.exists(DEFAULT_BACKGROUND):
-        background_image = DEFAULT_BACKGROUND
-    
-    # 定义应用中使用的基础颜色（从旧版应用迁移过来的颜色方案）
-    base_bg = "#2b2b2b"        # 基础背景色（深灰色）
-    text_color = "#ffffff"      # 文本颜色（白色）
-    border_color = "#3f3f3f"    # 边框颜色（中灰色）
-    hover_bg = "#3f3f3f"        # 悬停背景色（中灰色）
-    disabled_bg = "#404040"     # 禁用状态背景色（灰色）
-    disabled_text = "#808080"   # 禁用状态文本颜色（浅灰色）
-    
-    # 处理背景图片样式
-    background_style = ""
-    if background_image:
-        # 将Windows路径分隔符(\)转换为URL兼容的正斜杠(/)
-        bg_path = background_image.replace('\\', '/')
-        # 创建背景图片CSS样式
-        background_style = f"""
-            QMainWindow, QDialog {{
-                background-image: url("{bg_path}");  /* 设置背景图片 */
-                background-position: center;         /* 背景图片居中 */
-                background-repeat: no-repeat;        /* 背景图片不重复 */
-                background-attachment: fixed;        /* 背景图片固定，不随滚动条滚动 */
-            }}
-        """
-    
-    # 返回完整的样式表，包括背景样式和其他UI元素样式
-    return background_style + f"""
+# 默认背景图片路径，指向src目录下的background.png，仅在模块加载时检查一次
+_DEFAULT_BACKGROUND = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),  # 获取当前文件所在目录(ui)的父目录(src)
+    'background.png'
+)
+_DEFAULT_BG_EXISTS = os.path.exists(_DEFAULT_BACKGROUND)
+
+# 定义应用中使用的基础颜色（从旧版应用迁移过来的颜色方案）
+_BASE_COLORS = {
+    'base_bg': "#2b2b2b",        # 基础背景色（深灰色）
+    'text_color': "#ffffff",     # 文本颜色（白色）
+    'border_color': "#3f3f3f",   # 边框颜色（中灰色）
+    'hover_bg': "#3f3f3f",       # 悬停背景色（中灰色）
+    'disabled_bg': "#404040",    # 禁用状态背景色（灰色）
+    'disabled_text': "#808080",  # 禁用状态文本颜色（浅灰色）
+}
+
+# 已解码的背景图片缓存，按路径索引
+_BACKGROUND_PIXMAPS = {}
+
+# UI元素样式模板
+_STYLE_TEMPLATE = """
         /* 全局字体设置 */
         QWidget {{
             font-family: "Microsoft YaHei";  /* 使用微软雅黑字体 */
@@ -122,6 +101,12 @@ def get_style(accent_color, background_image=None):
             border-radius: 2px;                       /* 圆角边框 */
         }}
         
+        /* 日志窗口文本区域使用等宽字体 */
+        QTextEdit#logArea {{
+            font-family: "Consolas", monospace;
+            font-size: 9pt;
+        }}
+        
         /* 标签样式 */
         QLabel {{
             color: {text_color};           /* 标签文本颜色 */
@@ -151,4 +136,85 @@ def get_style(accent_color, background_image=None):
         QMenuBar::item:selected {{
             background-color: {hover_bg};  /* 选中时的背景色 */
         }}
-    """
\ No newline at end of file
+        
+        /* 主窗口标题样式 */
+        QLabel#mainTitle {{
+            font-size: 18px;      /* 标题字号 */
+            font-weight: bold;    /* 粗体 */
+            margin-bottom: 15px;  /* 底部外边距 */
+        }}
+        
+        /* 对话框标题样式 */
+        QLabel#dialogTitle {{
+            font-size: 16px;      /* 标题字号 */
+            font-weight: bold;    /* 粗体 */
+            margin-bottom: 10px;  /* 底部外边距 */
+        }}
+        
+        /* 强调色预览块样式 */
+        QLabel#colorSwatch {{
+            background-color: {accent_color};  /* 显示当前强调色 */
+            border: 1px solid #999;            /* 浅灰色边框 */
+        }}
+    """
+
+def get_background_pixmap(background_image=None):
+    """
+    获取背景图片
+    
+    参数:
+        background_image: 可选，背景图片路径。如果未提供，将使用默认背景
+    
+    返回:
+        QPixmap: 解码后的背景图片，无可用图片时返回None
+    """
+    # 如果未提供背景图片且默认背景图片存在，则使用默认背景
+    if not background_image and _DEFAULT_BG_EXISTS:
+        background_image = _DEFAULT_BACKGROUND
+    if not background_image:
+        return None
+    
+    # 每个路径只解码一次
+    if background_image not in _BACKGROUND_PIXMAPS:
+        pixmap = QPixmap(background_image)
+        _BACKGROUND_PIXMAPS[background_image] = None if pixmap.isNull() else pixmap
+    return _BACKGROUND_PIXMAPS[background_image]
+
+class BackgroundMixin:
+    """
+    背景图片绘制混入类
+    
+    在窗口绘制时直接居中绘制已解码的背景图片，替代样式表中的background-image，
+    避免样式表引擎在每次重绘时重新解析图片。需放在Qt窗口基类之前继承。
+    """
+    _background_pixmap = None
+    
+    def set_background_image(self, background_image=None):
+        """设置背景图片，传入空值时使用默认背景"""
+        self._background_pixmap = get_background_pixmap(background_image)
+        self.update()
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        pixmap = self._background_pixmap
+        if pixmap is not None:
+            # 背景图片居中、不缩放、不重复
+            painter = QPainter(self)
+            painter.drawPixmap((self.width() - pixmap.width()) // 2,
+                               (self.height() - pixmap.height()) // 2,
+                               pixmap)
+            painter.end()
+
+@lru_cache(maxsize=8)
+def get_style(accent_color):
+    """
+    获取应用样式表
+    
+    参数:
+        accent_color: 强调色，用于按钮等UI元素
+    
+    返回:
+        str: 包含完整Qt样式表的字符串
+    """
+    # 背景图片由BackgroundMixin直接绘制，不再写入样式表
+    return _STYLE_TEMPLATE.format_map(dict(_BASE_COLORS, accent_color=accent_color))
@@ -1,10 +1,15 @@
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QGraphicsItem
+from PySide6.QtGui import QColor
 from collections import deque
 import pyqtgraph as pg
 import numpy as np
 from utils.i18n import i18n
 import logging
 
+# 每个通道显示的最大数据点数
+WAVE_POINTS = 100
+
 class WaveManagerUI:
     """波形图管理UI逻辑"""
     
@@ -12,22 +17,59 @@ class WaveManagerUI:
         self.main_window = main_window
         self.signals = main_window.signals
         
-        # 初始化波形数据
-        self.wave_data = {'A': [], 'B': []}
-        self.wave_indices = {'A': [], 'B': []}
-        self.wave_queues = {'A': deque(maxlen=100), 'B': deque(maxlen=100)}
-        self.data_points = 0
+        # 初始化波形数据：强度值存放在双倍长度的环形缓冲区，每个数据同时写入i和i+WAVE_POINTS，
+        # 任意时刻最近WAVE_POINTS个数据都是一段连续切片，可直接传给setData
+        self._y = {ch: np.zeros(WAVE_POINTS * 2, dtype=np.float64) for ch in ('A', 'B')}
+        # X轴为各通道的样本序号，由固定序列加偏移得到，写入预分配的缓冲区
+        self._x_static = np.arange(WAVE_POINTS, dtype=np.float64)
+        self._x_view = {ch: np.empty(WAVE_POINTS, dtype=np.float64) for ch in ('A', 'B')}
+        # 各通道单调递增的写入计数，写入位置为计数对WAVE_POINTS取模，
+        # 有效数据量为min(计数, WAVE_POINTS)；溢出时自然覆盖最旧数据，无需额外的索引和长度
+        self.data_points = {'A': 0, 'B': 0}
+        # 批量数据限幅用的临时缓冲区
+        self._batch_buf = np.empty(WAVE_POINTS, dtype=np.float64)
+        # 标记需要重绘的通道，由定时器统一刷新
+        self._dirty = {'A': False, 'B': False}
+        # 各通道最后一个数据及其连续重复的次数，用于跳过稳定强度下的重绘
+        self._last_val = {'A': None, 'B': None}
+        self._same_run = {'A': 0, 'B': 0}
+        # 缓存的最大强度，同时作为当前Y轴上限，随strength_changed信号刷新
+        self._max_strength = {'A': None, 'B': None}
+        
+        # 创建波形曲线，两条曲线共用同一支画笔
+        self._pen_color = self.main_window.accent_color
+        self._curve_pen = pg.mkPen(color=self._pen_color, width=2)
+        self.curve_a = self.main_window.plot_widget_a.plot(pen=self._curve_pen)
+        self.curve_b = self.main_window.plot_widget_b.plot(pen=self._curve_pen)
         
-        # 创建波形曲线
-        self.curve_a = self.main_window.plot_widget_a.plot(pen=pg.mkPen(color=self.main_window.accent_color, width=2))
-        self.curve_b = self.main_window.plot_widget_b.plot(pen=pg.mkPen(color=self.main_window.accent_color, width=2))
+        for curve in (self.curve_a, self.curve_b):
+            # 缓存曲线的绘制结果，曲线未变化时重绘只需贴图
+            curve.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        for plot_widget in (self.main_window.plot_widget_a, self.main_window.plot_widget_b):
+            # 波形图范围由程序控制，禁用鼠标交互、菜单和自动缩放
+            plot_widget.setMouseEnabled(x=False, y=False)
+            plot_widget.hideButtons()
+            plot_widget.setMenuEnabled(False)
+            plot_widget.disableAutoRange()
         
         # 设置波形图范围
         self.update_plot_ranges()
         
         # 设置波形图背景为透明
-        self.main_window.plot_widget_a.setBackground(None)
-        self.main_window.plot_widget_b.setBackground(None)
+        self.main_window.wave_view.setBackground(None)
+        
+        # 重绘定时器：约30Hz 合并刷新，粗精度定时器可被系统合并唤醒
+        self.update_timer = QTimer()
+        self.update_timer.setTimerType(Qt.CoarseTimer)
+        self.update_timer.setInterval(33)
+        self.update_timer.timeout.connect(self.update_plot)
+        
+        # 待发送的日志消息，由定时器每100ms批量发送一次
+        self._log_ring = deque(maxlen=1024)
+        self._log_timer = QTimer()
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
         
         # 设置信号连接
         self.setup_connections()
@@ -36,10 +78,13 @@ class WaveManagerUI:
         self.clear_channel_data('A')
         self.clear_channel_data('B')
         
+        self.update_timer.start()
+        
     def setup_connections(self):
         """设置信号连接"""
         # 波形数据更新信号
         self.signals.wave_data_updated.connect(self.update_wave_data)
+        self.signals.wave_data_batch.connect(self.update_wave_batch)
         # 强度设置更新信号
         self.signals.strength_changed.connect(self.update_plot_ranges)
         
@@ -49,12 +94,49 @@ class WaveManagerUI:
         max_strength_a = self.main_window.ble_manager.max_strength['A']
         max_strength_b = self.main_window.ble_manager.max_strength['B']
         
-        # 设置Y轴范围
-        self.main_window.plot_widget_a.setYRange(0, max_strength_a)
-        self.main_window.plot_widget_b.setYRange(0, max_strength_b)
-        # X轴范围保持不变
-        self.main_window.plot_widget_a.setXRange(0, 100)
-        self.main_window.plot_widget_b.setXRange(0, 100)
+        # 设置Y轴范围，上限未变化时跳过
+        if max_strength_a != self._max_strength['A']:
+            self._max_strength['A'] = max_strength_a
+            self.main_window.plot_widget_a.setYRange(0, max_strength_a)
+        if max_strength_b != self._max_strength['B']:
+            self._max_strength['B'] = max_strength_b
+            self.main_window.plot_widget_b.setYRange(0, max_strength_b)
+        # X轴范围保持不变；已有数据的通道由update_plot按数据滚动显示窗口，
+        # 这里重置会使强度不变期间（不再重绘）的曲线移出可见范围
+        if not self.data_points['A']:
+            self.main_window.plot_widget_a.setXRange(0, 100)
+        if not self.data_points['B']:
+            self.main_window.plot_widget_b.setXRange(0, 100)
+
+    @staticmethod
+    def _validate(data_dict):
+        """验证波形数据
+        
+        Args:
+            data_dict: 波形数据字典
+            
+        Returns:
+            (通道, 强度值)，数据无效时返回None
+        """
+        channel = data_dict.get('channel')
+        data = data_dict.get('data')
+        
+        # 验证通道
+        if channel not in ('A', 'B'):
+            logging.warning(f"无效的通道: {channel}")
+            return None
+            
+        # 验证数据
+        if data is None:
+            logging.warning("数据为空")
+            return None
+            
+        # 确保数据是数值类型
+        try:
+            return channel, float(data)
+        except (ValueError, TypeError):
+            logging.error(f"无效的强度值: {data}")
+            return None
 
     def update_wave_data(self, data_dict):
         """更新波形数据
@@ -66,56 +148,134 @@ class WaveManagerUI:
                     'data': 强度值(整数)
                 }
         """
-        try:
-            channel = data_dict.get('channel')
-            data = data_dict.get('data')
+        validated = self._validate(data_dict)
+        if validated is None:
+            return
+        channel, strength = validated
+        # 限制强度在0到最大强度之间
+        strength = max(0.0, min(self._max_strength[channel], strength))
+            
+        # 写入环形缓冲区，曲线由定时器统一重绘
+        index = self.data_points[channel] % WAVE_POINTS
+        self._y[channel][index] = self._y[channel][index + WAVE_POINTS] = strength
+        # 先写数据再推进计数，重绘时读到的计数范围内的数据均已写入
+        self.data_points[channel] += 1
+        
+        # 强度与上一个数据相同且重复数据已占满显示窗口时，曲线仍是同一条水平线，无需重绘
+        if strength != self._last_val[channel]:
+            self._last_val[channel] = strength
+            self._same_run[channel] = 1
+        elif self._same_run[channel] < WAVE_POINTS:
+            self._same_run[channel] += 1
+        else:
+            return
+        self._dirty[channel] = True
             
-            # 验证通道
-            if not channel or channel not in ['A', 'B']:
+    def update_wave_batch(self, batch):
+        """批量更新波形数据
+        
+        Args:
+            batch: 通道到强度序列的字典，格式为：
+                {
+                    'A': 强度数组或列表,
+                    'B': 强度数组或列表
+                }
+        """
+        for channel, samples in batch.items():
+            if channel not in ('A', 'B'):
                 logging.warning(f"无效的通道: {channel}")
-                return
+                continue
                 
-            # 验证数据
-            if data is None:
-                logging.warning("数据为空")
-                return
-                
-            # 确保数据是数值类型
             try:
-                strength = float(data)
-                # 限制强度不小于0，但上限跟随最大强度设置
-                max_strength = self.main_window.ble_manager.max_strength[channel]
-                strength = max(0, min(max_strength, strength))
+                values = np.asarray(samples, dtype=np.float64).ravel()
             except (ValueError, TypeError):
-                logging.error(f"无效的强度值: {data}")
-                return
+                logging.error(f"无效的强度值: {samples}")
+                continue
+            if not values.size:
+                continue
                 
-            # 添加数据点
-            self.data_points += 1
-            self.wave_queues[channel].append((self.data_points, strength))
+            # 只需保留最后WAVE_POINTS个数据，其写入位置按被丢弃的数据一并推进
+            total = values.size
+            values = values[-WAVE_POINTS:]
+            size = values.size
             
-            # 更新波形数据
-            self.wave_indices[channel] = [p[0] for p in self.wave_queues[channel]]
-            self.wave_data[channel] = [p[1] for p in self.wave_queues[channel]]
+            # 整批限制强度范围，结果写入临时缓冲区，再分段写入环形缓冲区的两份副本
+            values = np.clip(values, 0.0, self._max_strength[channel], out=self._batch_buf[:size])
+            buffer = self._y[channel]
+            index = (self.data_points[channel] + total - size) % WAVE_POINTS
+            first = min(size, WAVE_POINTS - index)
+            buffer[index:index + first] = values[:first]
+            buffer[index + WAVE_POINTS:index + WAVE_POINTS + first] = values[:first]
+            rest = size - first
+            if rest:
+                buffer[:rest] = values[first:]
+                buffer[WAVE_POINTS:WAVE_POINTS + rest] = values[first:]
+                
+            self.data_points[channel] += total
+            self._last_val[channel] = None
+            self._same_run[channel] = 0
+            self._dirty[channel] = True
+            
+    def update_plot(self):
+        """定时重绘有新数据的通道"""
+        # 窗口不可见或波形区域被遮挡时跳过，保留脏标记待可见后再重绘
+        main_window = self.main_window
+        if (not main_window.isVisible() or main_window.isMinimized()
+                or main_window.wave_view.visibleRegion().isEmpty()):
+            return
+            
+        for channel in ('A', 'B'):
+            if not self._dirty[channel]:
+                continue
+            self._dirty[channel] = False
+            
+            # 读取一次写入计数，本次重绘只使用该计数之前的数据
+            data_points = self.data_points[channel]
+            count = min(data_points, WAVE_POINTS)
+            if not count:
+                continue
+            
+            # 最近count个数据在缓冲区中的连续切片
+            end = data_points % WAVE_POINTS + WAVE_POINTS
+            # X轴：最后一个数据的序号为该通道的样本总数
+            x_view = self._x_view[channel][:count]
+            np.add(self._x_static[:count], data_points - count + 1, out=x_view)
+            # 数据写入时已限幅，直接使用缓冲区切片
+            y_view = self._y[channel][end - count:end]
             
-            # 更新曲线
             if channel == 'A':
-                self.curve_a.setData(self.wave_indices[channel], self.wave_data[channel])
+                curve, plot_widget = self.curve_a, self.main_window.plot_widget_a
             else:
-                self.curve_b.setData(self.wave_indices[channel], self.wave_data[channel])
-                
+                curve, plot_widget = self.curve_b, self.main_window.plot_widget_b
+            
+            # 更新曲线
+            curve.setData(x_view, y_view)
+            
             # 自动调整X轴范围，保持最近的100个点可见
-            if self.wave_indices[channel]:
-                max_x = max(self.wave_indices[channel])
-                min_x = max_x - 100 if max_x > 100 else 0
-                if channel == 'A':
-                    self.main_window.plot_widget_a.setXRange(min_x, max_x)
-                else:
-                    self.main_window.plot_widget_b.setXRange(min_x, max_x)
-                    
-        except Exception as e:
-            logging.error(f"更新波形数据失败: {str(e)}")
-            self.signals.log_message.emit(f"更新波形数据失败: {str(e)}")
+            max_x = data_points
+            min_x = max_x - WAVE_POINTS if max_x > WAVE_POINTS else 0
+            plot_widget.setXRange(min_x, max_x)
+                
+    def _log(self, message):
+        """缓存日志消息，稍后批量发送"""
+        self._log_ring.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+            
+    def _flush_log(self):
+        """批量发送缓存的日志消息"""
+        if self._log_ring:
+            self.signals.log_message.emit("\n".join(self._log_ring))
+            self._log_ring.clear()
+            
+    def pause_updates(self):
+        """窗口隐藏或最小化时停止重绘"""
+        self.update_timer.stop()
+        
+    def resume_updates(self):
+        """窗口恢复显示时继续重绘"""
+        if not self.update_timer.isActive():
+            self.update_timer.start()
             
     # 删除init_test_data方法，不再生成测试数据
             
@@ -130,29 +290,35 @@ class WaveManagerUI:
                 logging.warning(f"无效的通道: {channel}")
                 return
                 
-            # 清空队列
-            self.wave_queues[channel].clear()
-            self.wave_indices[channel] = []
-            self.wave_data[channel] = []
+            # 清空缓冲区
+            self.data_points[channel] = 0
+            self._dirty[channel] = False
+            self._last_val[channel] = None
+            self._same_run[channel] = 0
             
             # 更新曲线
             if channel == 'A':
-                self.curve_a.setData([], [])
+                self.curve_a.setData(self._x_static[:0], self._y['A'][:0])
                 # 重置X轴范围
                 self.main_window.plot_widget_a.setXRange(0, 100)
             else:
-                self.curve_b.setData([], [])
+                self.curve_b.setData(self._x_static[:0], self._y['B'][:0])
                 # 重置X轴范围
                 self.main_window.plot_widget_b.setXRange(0, 100)
                 
-            self.signals.log_message.emit(i18n.translate("status_updates.queue_cleared", channel))
+            self._log(i18n.translate("status_updates.queue_cleared", channel))
             
         except Exception as e:
             logging.error(f"清除通道{channel}数据失败: {str(e)}")
-            self.signals.log_message.emit(f"清除通道{channel}数据失败: {str(e)}")
+            self._log(f"清除通道{channel}数据失败: {str(e)}")
 
     def apply_theme(self):
         """应用主题样式，更新波形曲线颜色"""
-        # 更新曲线颜色
-        self.curve_a.setPen(pg.mkPen(color=self.main_window.accent_color, width=2))
-        self.curve_b.setPen(pg.mkPen(color=self.main_window.accent_color, width=2))
\ No newline at end of file
+        # 颜色未变化时直接返回，变化时修改已有画笔的颜色而不重新创建
+        if self.main_window.accent_color == self._pen_color:
+            return
+        self._pen_color = self.main_window.accent_color
+        self._curve_pen.setColor(QColor(self._pen_color))
+        # 曲线保存的是画笔副本，需重新设置才能生效
+        self.curve_a.setPen(self._curve_pen)
+        self.curve_b.setPen(self._curve_pen)
\ No newline at end of file
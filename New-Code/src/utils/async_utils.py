@@ -19,16 +19,15 @@ def asyncSlot(*args, **kwargs):
         @functools.wraps(func)
         @Slot(*args, **kwargs)
         def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 如果事件循环已经在运行，创建一个任务
-                # 使用ensure_future而不是create_task，以便更好地处理任务嵌套
-                future = asyncio.ensure_future(func(*args, **kwargs))
-                # 返回future以便调用者可以等待结果
-                return future
-            else:
+            try:
+                # 如果事件循环已经在运行，直接在该循环上创建一个任务
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
                 # 如果事件循环未运行，使用run_until_complete
-                return loop.run_until_complete(func(*args, **kwargs))
+                return asyncio.get_event_loop().run_until_complete(func(*args, **kwargs))
+            # 使用ensure_future而不是create_task，以便更好地处理任务嵌套
+            # 返回future以便调用者可以等待结果
+            return asyncio.ensure_future(func(*args, **kwargs), loop=loop)
         return wrapper
     return decorator
 
@@ -49,12 +48,12 @@ def run_async(func):
     """
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
         # 检查当前是否已经在事件循环中运行
-        if loop.is_running():
-            # 如果已经在事件循环中，使用ensure_future而不是create_task
-            return asyncio.ensure_future(func(*args, **kwargs))
-        else:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
             # 如果不在事件循环中，使用run_until_complete
-            return loop.run_until_complete(func(*args, **kwargs))
+            return asyncio.get_event_loop().run_until_complete(func(*args, **kwargs))
+        # 如果已经在事件循环中，使用ensure_future而不是create_task
+        return asyncio.ensure_future(func(*args, **kwargs), loop=loop)
     return wrapper
\ No newline at end of file
@@ -1,7 +1,17 @@
 import os
+import re
 import json
+import string
 import logging
 from config.settings import settings  # 导入设置模块
+from utils import json_utils
+
+# 语言名称位于语言文件开头，只需读取文件头部即可获取
+_LANG_NAME_HEAD_SIZE = 512
+# 用于预解析翻译模板的格式化器
+_FORMATTER = string.Formatter()
+
+_LANG_NAME_RE = re.compile(rb'"language_name"\s*:\s*"((?:[^"\\]|\\.)*)"')
 
 class I18n:
     def __init__(self):
@@ -9,26 +19,31 @@ class I18n:
         self.lang_path = os.path.abspath(os.path.join(current_dir, '..', 'languages'))
         os.makedirs(self.lang_path, exist_ok=True)
         self.translations = {}
+        self._flat = {}  # 展平后的翻译表，键为 "group.key" 形式
+        self._available_languages = None  # 可用语言缓存 {语言代码: 语言名称}
+        self._lang_dir_mtime = None  # 缓存对应的语言目录修改时间
+        self._cache = {}  # 已解析的语言包 {语言代码: (文件修改时间, 翻译字典, 展平后的翻译表)}
+        self._compiled = {}  # 预解析的翻译模板 {模板: ((文本, 字段名), ...)}，复杂模板为None
         self.current_lang = "en_US"  # 默认使用英文
         
-        logging.info(f"Language path initialized at: {self.lang_path}")
+        logging.info("Language path initialized at: %s", self.lang_path)
         if not os.path.exists(self.lang_path):
-            logging.error(f"Language directory not found: {self.lang_path}")
+            logging.error("Language directory not found: %s", self.lang_path)
             return
         
         # 添加详细日志，输出settings对象的内容
-        logging.info(f"Settings object: language={getattr(settings, 'language', 'not found')}")
+        logging.info("Settings object: language=%s", getattr(settings, 'language', 'not found'))
         
         # 自动加载默认语言
         try:
             # 尝试从设置中加载语言
             if hasattr(settings, 'language') and settings.language:
                 self.current_lang = settings.language
-                logging.info(f"Loading language from settings: {self.current_lang}")
+                logging.info("Loading language from settings: %s", self.current_lang)
             # 记录当前语言设置
-            logging.info(f"Current language set to: {self.current_lang}")
+            logging.info("Current language set to: %s", self.current_lang)
         except Exception as e:
-            logging.error(f"Error loading language from settings: {str(e)}")
+            logging.error("Error loading language from settings: %s", e)
             
         # 确保语言文件存在并加载
         if not self.load_language(self.current_lang, save_to_config=False):  # 修改这里，不保存到配置文件
@@ -38,26 +53,55 @@ class I18n:
                 self.load_language("en_US", save_to_config=False)
 
     def load_languages(self):
-        """加载所有可用的语言包"""
-        languages = {}
+        """加载所有可用的语言包
+        
+        结果按语言目录的修改时间缓存，目录未变化时直接返回缓存
+        """
         try:
-            lang_files = os.listdir(self.lang_path)
+            mtime = os.stat(self.lang_path).st_mtime
+        except OSError as e:
+            logging.error("Failed to list language directory: %s", e)
+            return {}
             
-            for file in lang_files:
-                if file.endswith('.json'):
-                    lang_code = os.path.splitext(file)[0]
+        if self._available_languages is not None and mtime == self._lang_dir_mtime:
+            return dict(self._available_languages)
+            
+        languages = {}
+        try:
+            with os.scandir(self.lang_path) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json') or not entry.is_file():
+                        continue
+                    lang_code = entry.name[:-len('.json')]
                     try:
-                        with open(os.path.join(self.lang_path, file), 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            if "language_name" in data:
-                                languages[lang_code] = data["language_name"]
-                                logging.info(f"Found language: {lang_code} - {data['language_name']}")
+                        language_name = self._read_language_name(entry.path)
+                        if language_name is not None:
+                            languages[lang_code] = language_name
+                            logging.info("Found language: %s - %s", lang_code, language_name)
                     except Exception as e:
-                        logging.error(f"Failed to load language file {file}: {str(e)}")
+                        logging.error("Failed to load language file %s: %s", entry.name, e)
         except Exception as e:
-            logging.error(f"Failed to list language directory: {str(e)}")
-                    
-        return languages
+            logging.error("Failed to list language directory: %s", e)
+            return languages
+            
+        self._available_languages = languages
+        self._lang_dir_mtime = mtime
+        return dict(languages)
+
+    @staticmethod
+    def _read_language_name(file_path):
+        """读取语言文件中的language_name
+        
+        先在文件头部查找，找不到时再解析整个文件
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(_LANG_NAME_HEAD_SIZE)
+            match = _LANG_NAME_RE.search(head)
+            if match:
+                # 按JSON字符串解码，正确处理转义字符
+                return json.loads(b'"' + match.group(1) + b'"')
+            data = json_utils.loads(head + f.read())
+        return data.get("language_name") if isinstance(data, dict) else None
 
     def load_language(self, lang_code, save_to_config=True):
         """加载指定的语言包
@@ -72,40 +116,105 @@ class I18n:
             
         try:
             file_path = os.path.join(self.lang_path, f"{lang_code}.json")
-            if not os.path.exists(file_path):
-                logging.error(f"Language file does not exist: {file_path}")
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime is None:
+                logging.error("Language file does not exist: %s", file_path)
                 # 如果指定的语言文件不存在，尝试加载英文
                 if lang_code != "en_US":
                     logging.info("Trying to load default English language")
                     return self.load_language("en_US")
                 return False
                 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    new_translations = json.load(f)
+            try:
+                # 切换回已加载过且文件未修改的语言时直接使用缓存，无需重新解析
+                cached = self._cache.get(lang_code)
+                if cached is not None and cached[0] == mtime:
+                    new_translations, flat = cached[1], cached[2]
+                else:
+                    new_translations = json_utils.load_file(file_path)
                     # 验证语言文件格式
                     if not isinstance(new_translations, dict):
-                        logging.error(f"Invalid language file format for {lang_code}")
+                        logging.error("Invalid language file format for %s", lang_code)
                         return False
-                        
-                    self.translations = new_translations
-                    self.current_lang = lang_code
+                    flat = self._flatten(new_translations)
+                    self._cache[lang_code] = (mtime, new_translations, flat)
                     
-                    # 只有在需要时才更新设置并保存到配置文件
-                    if save_to_config:
-                        settings.language = lang_code
-                        settings.save()
-                        logging.info(f"Successfully loaded language: {lang_code} and saved to config")
-                    else:
-                        logging.info(f"Successfully loaded language: {lang_code} (not saved to config)")
-                    return True
-                except json.JSONDecodeError as e:
-                    logging.error(f"Language file {lang_code} format error: {str(e)}")
-                    return False
+                self.translations = new_translations
+                self._flat = flat
+                self.current_lang = lang_code
+                
+                # 只有在需要时才更新设置并保存到配置文件
+                if save_to_config:
+                    settings.language = lang_code
+                    settings.save()
+                    logging.info("Successfully loaded language: %s and saved to config", lang_code)
+                else:
+                    logging.info("Successfully loaded language: %s (not saved to config)", lang_code)
+                return True
+            except json_utils.JSONDecodeError as e:
+                logging.error("Language file %s format error: %s", lang_code, e)
+                return False
         except Exception as e:
-            logging.error(f"Failed to load language pack: {str(e)}")
+            logging.error("Failed to load language pack: %s", e)
             return False
             
+    @staticmethod
+    def _flatten(translations, prefix=''):
+        """将嵌套的翻译字典展平为点分隔键的字典，值在展平时统一转换为字符串
+        
+        Args:
+            translations: 嵌套的翻译字典
+            prefix: 当前层级的键前缀
+        """
+        flat = {}
+        for k, v in translations.items():
+            full_key = f"{prefix}{k}"
+            if isinstance(v, dict):
+                flat.update(I18n._flatten(v, f"{full_key}."))
+            else:
+                flat[full_key] = str(v)
+        return flat
+            
+    def _compile(self, template):
+        """预解析翻译模板
+        
+        只处理不带转换和格式说明的简单字段（如 {0}、{}、{channel}），
+        其他模板返回None，交由str.format处理
+        """
+        try:
+            return self._compiled[template]
+        except KeyError:
+            pass
+            
+        parts = []
+        auto_index = 0
+        try:
+            for literal, field, spec, conversion in _FORMATTER.parse(template):
+                if field is None:
+                    parts.append((literal, None))
+                    continue
+                if spec or conversion:
+                    parts = None
+                    break
+                if field == '':
+                    field = auto_index
+                    auto_index += 1
+                elif field.isdigit():
+                    field = int(field)
+                elif not field.isidentifier():
+                    parts = None
+                    break
+                parts.append((literal, field))
+        except ValueError:
+            parts = None
+            
+        compiled = tuple(parts) if parts is not None else None
+        self._compiled[template] = compiled
+        return compiled
+        
     def translate(self, key: str, *args, **kwargs) -> str:
         """翻译指定的文本键值
         
@@ -117,41 +226,42 @@ class I18n:
         Returns:
             翻译后的文本，如果找不到对应的键值则返回原键值
         """
-        if not key:
-            return ""
-            
-        try:
-            # 处理嵌套键，如 "group.connection"
-            keys = key.split('.')
-            value = self.translations
-            
-            for k in keys:
-                if not isinstance(value, dict):
-                    logging.debug(f"Translation path broken at '{k}' for key '{key}'")
-                    return key
-                value = value.get(k)
-                if value is None:
-                    logging.debug(f"Translation key not found: '{key}'")
-                    return key
-            
-            # 确保value是字符串类型
-            value = str(value)
-                    
-            if args or kwargs:
-                try:
-                    if args and isinstance(args[0], dict) and len(args) == 1:
-                        # 处理字典参数 - 用于支持 {channel} 形式的占位符
-                        return value.format(**args[0])
-                    else:
-                        # 处理位置参数和命名参数
-                        return value.format(*args, **kwargs)
-                except (KeyError, IndexError, ValueError) as e:
-                    logging.error(f"Format error for key '{key}': {str(e)}")
-                    return value
-            return value
-        except Exception as e:
-            logging.debug(f"Translation failed for key '{key}': {str(e)}")
+        # 无格式化参数时只需一次查找，展平时已转换为字符串
+        value = self._flat.get(key)
+        if value is None:
+            if not key:
+                return ""
+            logging.debug("Translation key not found: '%s'", key)
             return key
+                
+        if args or kwargs:
+            # 不含占位符的纯文本无需格式化
+            if '{' not in value:
+                return value
+            try:
+                # 简单模板直接拼接，跳过通用的格式化流程；位置参数和命名参数混用时交由str.format处理
+                compiled = None if args and kwargs else self._compile(value)
+                if compiled is not None:
+                    if kwargs:
+                        source = kwargs
+                    elif len(args) == 1 and isinstance(args[0], dict):
+                        source = args[0]
+                    else:
+                        source = args
+                    return ''.join(
+                        literal if field is None else literal + str(source[field])
+                        for literal, field in compiled
+                    )
+                if args and isinstance(args[0], dict) and len(args) == 1:
+                    # 处理字典参数 - 用于支持 {channel} 形式的占位符
+                    return value.format(**args[0])
+                else:
+                    # 处理位置参数和命名参数
+                    return value.format(*args, **kwargs)
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                logging.error("Format error for key '%s': %s", key, e)
+                return value
+        return value
 
 # 创建全局实例
 i18n = I18n()
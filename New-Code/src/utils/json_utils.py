@@ -0,0 +1,32 @@
+"""
+JSON解析工具
+
+优先使用orjson（可选依赖）解析，未安装时使用标准库json；
+orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，两种实现都可用 JSONDecodeError 捕获
+"""
+
+import json
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def load_file(file_path):
+    """读取并解析JSON文件
+    
+    以无缓冲的二进制方式一次读出整个文件，交给解析器直接处理UTF-8字节，
+    省去文本解码和缓冲层
+    
+    Args:
+        file_path: 文件路径
+        
+    Returns:
+        解析结果
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        return loads(f.read())
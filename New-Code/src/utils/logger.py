@@ -1,5 +1,5 @@
 import logging
-from PySide6.QtCore import Signal, QObject
+from PySide6.QtCore import Signal, QObject, SIGNAL
 import os
 from config.constants import LOG_DIR, LOG_FILE
 
@@ -11,6 +11,7 @@ class LogSignalEmitter(QObject):
         super().__init__()
         
 log_emitter = LogSignalEmitter()
+_LOG_SIGNAL = SIGNAL('log_signal(QString)')
 
 class QtHandler(logging.Handler):
     """将日志消息发送到Qt信号的处理器"""
@@ -19,48 +20,56 @@ class QtHandler(logging.Handler):
         self.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt='%H:%M:%S'))
         
     def emit(self, record):
+        # 日志窗口未显示时信号没有接收者，跳过格式化
+        if not log_emitter.receivers(_LOG_SIGNAL):
+            return
         msg = self.format(record)
         log_emitter.log_signal.emit(msg)
 
 def setup_logging():
-    """设置日志配置"""
-    # 移除所有现有的处理器
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    """设置日志配置，重复调用时直接返回"""
+    if getattr(setup_logging, '_done', False):
+        return
     
-    # 设置日志级别    
-    root_logger.setLevel(logging.DEBUG)  # 确保根日志记录器级别为DEBUG
-    
-    # 添加控制台处理器
+    # 控制台只显示INFO及以上级别
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)  # 控制台只显示INFO及以上级别
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setLevel(logging.INFO)
     
-    # 添加Qt信号处理器 - 确保UI中也能显示足够的日志
+    # Qt信号处理器 - 确保UI中也能显示足够的日志
     qt_handler = QtHandler()
-    qt_handler.setLevel(logging.INFO)  # 确保UI显示INFO及以上级别
-    root_logger.addHandler(qt_handler)
+    qt_handler.setLevel(logging.INFO)
+    
+    handlers = [console_handler, qt_handler]
     
-    # 添加文件处理器 - 确保记录所有级别的日志
+    # 文件处理器 - 确保记录所有级别的日志
+    file_error = None
     try:
         # 使用constants.py中定义的常量
         os.makedirs(LOG_DIR, exist_ok=True)
         
         # 使用 'w' 模式打开文件，这会清空现有内容
         file_handler = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)  # 确保文件记录所有DEBUG及以上级别
-        file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-        
-        logging.info(f"日志文件已创建: {LOG_FILE}")
+        file_handler.setLevel(logging.DEBUG)
+        handlers.append(file_handler)
     except Exception as e:
-        logging.error(f"创建日志文件失败: {str(e)}")
+        file_error = e
+    
+    # force=True 会先移除根日志记录器上已有的处理器；
+    # 未设置格式的控制台和文件处理器共用同一个Formatter，Qt处理器保留自己的格式
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers,
+        force=True,
+    )
     
     # 防止日志传播到父记录器，避免重复日志
-    root_logger.propagate = False
+    logging.getLogger().propagate = False
+    setup_logging._done = True
+    
+    if file_error is None:
+        logging.info("日志文件已创建: %s", LOG_FILE)
+    else:
+        logging.error("创建日志文件失败: %s", file_error)
     
-    logging.info("日志系统初始化完成")
\ No newline at end of file
+    logging.info("日志系统初始化完成")
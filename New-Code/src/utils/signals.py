@@ -19,6 +19,9 @@ class DeviceSignals(QObject):
     # 波形数据更新信号
     wave_data_updated = Signal(dict)
     
+    # 波形数据批量更新信号，格式为 {'A': 强度数组, 'B': 强度数组}
+    wave_data_batch = Signal(dict)
+    
     # 强度变更信号
     strength_changed = Signal()
     